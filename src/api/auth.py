@@ -47,11 +47,15 @@ class AuthHandler:
         """
         return {"Authorization": f"PVEAPIToken={self.user}!{token_name}={token_value}"}
 
-    async def authenticate_with_password(self, password: str) -> dict[str, str]:
+    async def authenticate_with_password(
+        self, password: str, client: httpx.AsyncClient | None = None
+    ) -> dict[str, str]:
         """Authenticate using username and password to get a ticket.
 
         Args:
             password: User password
+            client: Existing HTTP client to send the request with (a
+                temporary one is created when omitted)
 
         Returns:
             Headers dict with ticket and CSRF token
@@ -59,36 +63,24 @@ class AuthHandler:
         Raises:
             AuthenticationError: If authentication fails
         """
-        async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/access/ticket",
-                    data={"username": self.user, "password": password},
-                )
-
-                if response.status_code == 401:
-                    raise AuthenticationError("Invalid username or password")
-
-                response.raise_for_status()
-                data = response.json()["data"]
-
-                return {
-                    "Cookie": f"PVEAuthCookie={data['ticket']}",
-                    "CSRFPreventionToken": data["CSRFPreventionToken"],
-                }
-
-            except httpx.HTTPStatusError as e:
-                raise AuthenticationError(f"Authentication failed: {e}")
-            except httpx.RequestError as e:
-                raise AuthenticationError(f"Connection failed: {e}")
-            except KeyError:
-                raise AuthenticationError("Invalid response from server")
-
-    async def verify_authentication(self, headers: dict[str, str]) -> bool:
+        data = await self._request_ticket(password, client)
+        try:
+            return {
+                "Cookie": f"PVEAuthCookie={data['ticket']}",
+                "CSRFPreventionToken": data["CSRFPreventionToken"],
+            }
+        except KeyError:
+            raise AuthenticationError("Invalid response from server")
+
+    async def verify_authentication(
+        self, headers: dict[str, str], client: httpx.AsyncClient | None = None
+    ) -> bool:
         """Verify authentication is valid by making a test request.
 
         Args:
             headers: Authentication headers
+            client: Existing HTTP client to send the request with (a
+                temporary one is created when omitted)
 
         Returns:
             True if authentication is valid
@@ -96,24 +88,32 @@ class AuthHandler:
         Raises:
             AuthenticationError: If authentication verification fails
         """
-        async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
-            try:
-                response = await client.get(f"{self.base_url}/version", headers=headers)
-
-                if response.status_code == 401:
-                    raise AuthenticationError("Authentication invalid or expired")
-
-                response.raise_for_status()
-                return True
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    raise AuthenticationError("Authentication invalid or expired")
-                raise AuthenticationError(f"Verification failed: {e}")
-            except httpx.RequestError as e:
-                raise AuthenticationError(f"Connection failed: {e}")
-
-    async def get_fresh_ticket(self, password: str) -> str:
+        if client is None:
+            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+                return await self._verify(client, headers)
+        return await self._verify(client, headers)
+
+    async def _verify(self, client: httpx.AsyncClient, headers: dict[str, str]) -> bool:
+        """Send the verification request with the given client."""
+        try:
+            response = await client.get(f"{self.base_url}/version", headers=headers)
+
+            if response.status_code == 401:
+                raise AuthenticationError("Authentication invalid or expired")
+
+            response.raise_for_status()
+            return True
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                raise AuthenticationError("Authentication invalid or expired")
+            raise AuthenticationError(f"Verification failed: {e}")
+        except httpx.RequestError as e:
+            raise AuthenticationError(f"Connection failed: {e}")
+
+    async def get_fresh_ticket(
+        self, password: str, client: httpx.AsyncClient | None = None
+    ) -> str:
         """Get a fresh authentication ticket.
 
         This method creates a new ticket directly, useful for operations
@@ -121,6 +121,8 @@ class AuthHandler:
 
         Args:
             password: User password
+            client: Existing HTTP client to send the request with (a
+                temporary one is created when omitted)
 
         Returns:
             Fresh ticket string
@@ -128,24 +130,38 @@ class AuthHandler:
         Raises:
             AuthenticationError: If authentication fails
         """
-        async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/access/ticket",
-                    data={"username": self.user, "password": password},
-                )
-
-                if response.status_code == 401:
-                    raise AuthenticationError("Invalid username or password")
-
-                response.raise_for_status()
-                data = response.json()["data"]
-
-                return data["ticket"]
-
-            except httpx.HTTPStatusError as e:
-                raise AuthenticationError(f"Authentication failed: {e}")
-            except httpx.RequestError as e:
-                raise AuthenticationError(f"Connection failed: {e}")
-            except KeyError:
-                raise AuthenticationError("Invalid response from server")
+        data = await self._request_ticket(password, client)
+        try:
+            return data["ticket"]
+        except KeyError:
+            raise AuthenticationError("Invalid response from server")
+
+    async def _request_ticket(
+        self, password: str, client: httpx.AsyncClient | None
+    ) -> dict[str, Any]:
+        """Request a ticket, over the given client or a temporary one."""
+        if client is None:
+            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=self.timeout) as client:
+                return await self._post_ticket(client, password)
+        return await self._post_ticket(client, password)
+
+    async def _post_ticket(self, client: httpx.AsyncClient, password: str) -> dict[str, Any]:
+        """Send the ticket request with the given client."""
+        try:
+            response = await client.post(
+                f"{self.base_url}/access/ticket",
+                data={"username": self.user, "password": password},
+            )
+
+            if response.status_code == 401:
+                raise AuthenticationError("Invalid username or password")
+
+            response.raise_for_status()
+            return response.json()["data"]
+
+        except httpx.HTTPStatusError as e:
+            raise AuthenticationError(f"Authentication failed: {e}")
+        except httpx.RequestError as e:
+            raise AuthenticationError(f"Connection failed: {e}")
+        except KeyError:
+            raise AuthenticationError("Invalid response from server")
@@ -1,7 +1,10 @@
 """Proxmox VE API client."""
 
 import asyncio
-from typing import Any
+import random
+import time
+from collections.abc import Callable
+from typing import Any, BinaryIO
 
 import httpx
 
@@ -18,6 +21,13 @@ from .exceptions import (
 from ..models.config import ProfileConfig
 
 
+# Keep connections alive across the requests of one command, including the
+# asyncio.gather fan-outs used by listings and bulk actions
+_POOL_LIMITS = httpx.Limits(
+    max_connections=40, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
+
 def _upid_node(upid: str) -> str:
     """Extract the executing node from a UPID (format UPID:node:pid:...).
 
@@ -29,9 +39,34 @@ def _upid_node(upid: str) -> str:
     return ""
 
 
+class _ProgressReader:
+    """Binary file wrapper reporting the size of every chunk read.
+
+    httpx streams a multipart file part by calling read() in fixed size
+    chunks, so this reports upload progress without buffering the file.
+    """
+
+    def __init__(self, f: BinaryIO, callback: Callable[[int], None]) -> None:
+        self._f = f
+        self._callback = callback
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._f.read(size)
+        if chunk:
+            self._callback(len(chunk))
+        return chunk
+
+    def __getattr__(self, name: str) -> Any:
+        # seek/tell/fileno, used by httpx to size the part
+        return getattr(self._f, name)
+
+
 class ProxmoxClient:
     """Async client for Proxmox VE API."""
 
+    # Seconds a cached_get() response is reused within one client session
+    CACHE_TTL = 5.0
+
     def __init__(self, profile: ProfileConfig) -> None:
         """Initialize Proxmox client.
 
@@ -50,6 +85,7 @@ class ProxmoxClient:
         )
         self._headers: dict[str, str] | None = None
         self._client: httpx.AsyncClient | None = None
+        self._get_cache: dict[tuple[str, tuple], tuple[float, Any]] = {}
 
     async def __aenter__(self) -> "ProxmoxClient":
         """Async context manager entry.
@@ -75,23 +111,30 @@ class ProxmoxClient:
         if self.profile.auth.type == "token":
             if not self.profile.auth.token_name or not self.profile.auth.token_value:
                 raise AuthenticationError("Token name and value required for token auth")
-
-            self._headers = self.auth_handler.get_token_headers(
-                self.profile.auth.token_name, self.profile.auth.token_value
-            )
-        else:
-            if not self.profile.auth.password:
-                raise AuthenticationError("Password required for password auth")
-
-            self._headers = await self.auth_handler.authenticate_with_password(
-                self.profile.auth.password
-            )
+        elif not self.profile.auth.password:
+            raise AuthenticationError("Password required for password auth")
 
         self._client = httpx.AsyncClient(
-            verify=self.profile.verify_ssl, timeout=self.profile.timeout
+            verify=self.profile.verify_ssl,
+            timeout=self.profile.timeout,
+            limits=_POOL_LIMITS,
         )
 
-        await self.auth_handler.verify_authentication(self._headers)
+        # Authenticate and verify over the pooled client so its TLS
+        # connection is opened once and kept alive for the requests that follow
+        try:
+            if self.profile.auth.type == "token":
+                self._headers = self.auth_handler.get_token_headers(
+                    self.profile.auth.token_name, self.profile.auth.token_value
+                )
+            else:
+                self._headers = await self.auth_handler.authenticate_with_password(
+                    self.profile.auth.password, client=self._client
+                )
+            await self.auth_handler.verify_authentication(self._headers, client=self._client)
+        except BaseException:
+            await self.close()
+            raise
 
     async def close(self) -> None:
         """Close the client connection."""
@@ -109,7 +152,9 @@ class ProxmoxClient:
             Fresh ticket string or None for token auth
         """
         if self.profile.auth.type == "password" and self.profile.auth.password:
-            return await self.auth_handler.get_fresh_ticket(self.profile.auth.password)
+            return await self.auth_handler.get_fresh_ticket(
+                self.profile.auth.password, client=self._client
+            )
         return None
 
     def _ensure_connected(self) -> httpx.AsyncClient:
@@ -152,6 +197,9 @@ class ProxmoxClient:
         """
         client = self._ensure_connected()
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if method != "GET":
+            # Any write may change what a cached listing would return
+            self._get_cache.clear()
 
         for attempt in range(retry_count):
             try:
@@ -233,6 +281,36 @@ class ProxmoxClient:
         """
         return await self._request("GET", endpoint, params=params)
 
+    async def cached_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        ttl: float | None = None,
+    ) -> Any:
+        """Make a GET request, reusing a recent response for the same endpoint.
+
+        Meant for listings read several times by one command (a picker
+        followed by a lookup). The cache is dropped on any write request.
+        The returned data is shared with later calls: callers must not
+        mutate it, copy it first.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (part of the cache key)
+            ttl: Seconds a response stays valid (defaults to CACHE_TTL)
+
+        Returns:
+            Response data
+        """
+        ttl = self.CACHE_TTL if ttl is None else ttl
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        cached = self._get_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        data = await self.get(endpoint, params=params)
+        self._get_cache[key] = (time.monotonic(), data)
+        return data
+
     async def post(
         self,
         endpoint: str,
@@ -294,10 +372,13 @@ class ProxmoxClient:
     async def get_nodes(self) -> list[dict[str, Any]]:
         """Get list of cluster nodes.
 
+        Cached (see cached_get) so a node picker followed by a lookup in the
+        same command costs a single request.
+
         Returns:
             List of nodes
         """
-        return await self.get("/nodes")
+        return await self.cached_get("/nodes")
 
     async def get_node_status(self, node: str) -> dict[str, Any]:
         """Get status of a specific node.
@@ -544,6 +625,9 @@ class ProxmoxClient:
     ) -> list[dict[str, Any]]:
         """Get cluster resources.
 
+        Cached (see cached_get) so a VM or container picker followed by the
+        node lookup of the chosen guest costs a single request.
+
         Args:
             resource_type: Filter by type (vm, storage, node, etc.)
 
@@ -551,7 +635,7 @@ class ProxmoxClient:
             List of resources
         """
         params = {"type": resource_type} if resource_type else None
-        return await self.get("/cluster/resources", params=params)
+        return await self.cached_get("/cluster/resources", params=params)
 
     # VM (QEMU) methods
 
@@ -1024,15 +1108,29 @@ class ProxmoxClient:
         return await self.get(f"/nodes/{node}/tasks/{upid}/status")
 
     async def wait_for_task(
-        self, node: str, upid: str, timeout: int = 300, poll_interval: float = 2.0
+        self,
+        node: str,
+        upid: str,
+        timeout: int = 300,
+        poll_interval: float = 2.0,
+        initial_delay: float = 0.1,
+        handle_sigint: bool = True,
     ) -> dict[str, Any]:
         """Wait for a task to complete with Ctrl+C support.
 
+        Polls with exponential backoff: short tasks are noticed within a
+        fraction of a second, long ones are polled every poll_interval.
+
         Args:
             node: Node name
             upid: Task UPID
             timeout: Maximum wait time in seconds
-            poll_interval: Polling interval in seconds
+            poll_interval: Maximum polling interval in seconds
+            initial_delay: Delay before the second poll in seconds
+            handle_sigint: Install a SIGINT handler cancelling this wait.
+                Callers running several waits concurrently pass False and
+                handle Ctrl+C once themselves, as overlapping handlers are
+                not restored in install order.
 
         Returns:
             Final task status
@@ -1043,7 +1141,6 @@ class ProxmoxClient:
             asyncio.CancelledError: If interrupted by Ctrl+C
         """
         import signal
-        import time
 
         # The UPID embeds the node actually running the task
         # (UPID:node:pid:...), which can differ from the node the request
@@ -1064,8 +1161,10 @@ class ProxmoxClient:
                 if task and not task.done():
                     task.cancel()
 
-            old_handler = signal.signal(signal.SIGINT, signal_handler)
+            if handle_sigint:
+                old_handler = signal.signal(signal.SIGINT, signal_handler)
 
+            delay = initial_delay
             while True:
                 status = await self.get_task_status(node, upid)
 
@@ -1078,7 +1177,9 @@ class ProxmoxClient:
                 if time.time() - start_time > timeout:
                     raise TimeoutError(f"Task {upid} did not complete within {timeout} seconds")
 
-                await asyncio.sleep(poll_interval)
+                # Small jitter so parallel waiters do not poll in lockstep
+                await asyncio.sleep(delay + random.uniform(0, 0.05))
+                delay = min(poll_interval, delay * 1.6)
         finally:
             if old_handler is not None:
                 signal.signal(signal.SIGINT, old_handler)
@@ -1448,13 +1549,16 @@ class ProxmoxClient:
     async def get_storage_list(self, node: str) -> list[dict[str, Any]]:
         """Get list of storage on a node.
 
+        Cached (see cached_get) so a storage picker followed by the command
+        itself costs a single request.
+
         Args:
             node: Node name
 
         Returns:
             List of storage
         """
-        return await self.get(f"/nodes/{node}/storage")
+        return await self.cached_get(f"/nodes/{node}/storage")
 
     async def get_storage_status(self, node: str, storage: str) -> dict[str, Any]:
         """Get storage status.
@@ -1548,10 +1652,13 @@ class ProxmoxClient:
     async def get_cluster_options(self) -> dict[str, Any]:
         """Get cluster options.
 
+        Cached (see cached_get): commands read it for the tag color map,
+        sometimes more than once, e.g. on each visit of an edit tags menu.
+
         Returns:
             Cluster options
         """
-        return await self.get("/cluster/options")
+        return await self.cached_get("/cluster/options")
 
     async def update_cluster_options(self, **params: Any) -> None:
         """Update cluster options."""
@@ -1571,10 +1678,13 @@ class ProxmoxClient:
     async def get_pools(self) -> list[dict[str, Any]]:
         """Get list of resource pools.
 
+        Cached (see cached_get): pool pickers read it right before the command
+        fetches the chosen pool.
+
         Returns:
             List of pools
         """
-        return await self.get("/pools")
+        return await self.cached_get("/pools")
 
     async def get_pool(self, poolid: str) -> dict[str, Any]:
         """Get a resource pool with its members.
@@ -1626,13 +1736,15 @@ class ProxmoxClient:
     async def get_storage_config(self, storage: str) -> dict[str, Any]:
         """Get storage configuration.
 
+        Cached (see cached_get); an update drops the cache.
+
         Args:
             storage: Storage ID
 
         Returns:
             Storage configuration
         """
-        return await self.get(f"/storage/{storage}")
+        return await self.cached_get(f"/storage/{storage}")
 
     async def update_storage_config(
         self,
@@ -1788,9 +1900,12 @@ class ProxmoxClient:
         filename: str | None = None,
         checksum: str | None = None,
         checksum_algorithm: str | None = None,
+        progress: Callable[[int], None] | None = None,
     ) -> str:
         """Upload content to storage.
 
+        The file is streamed from disk in chunks, never read whole.
+
         Args:
             node: Node name
             storage: Storage ID
@@ -1799,6 +1914,7 @@ class ProxmoxClient:
             filename: Target filename (defaults to source filename)
             checksum: Expected checksum of the file
             checksum_algorithm: Algorithm to calculate checksum (md5, sha1, sha256, etc.)
+            progress: Called with the byte count of each chunk sent
 
         Returns:
             Upload task ID (UPID)
@@ -1827,7 +1943,8 @@ class ProxmoxClient:
         # Open file in context manager to ensure it's properly closed
         try:
             with open(file_path, "rb") as f:
-                files = {"filename": (filename, f, "application/octet-stream")}
+                body = _ProgressReader(f, progress) if progress else f
+                files = {"filename": (filename, body, "application/octet-stream")}
 
                 response = await client.request(
                     "POST", url, headers=self._headers, data=data, files=files
@@ -8,8 +8,9 @@ Each function takes callbacks/labels so it works for both resource types.
 
 import asyncio
 import time
-from collections.abc import Callable, Coroutine
-from typing import Any
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 import typer
 from rich.panel import Panel
@@ -58,6 +59,12 @@ from ..utils.network import resolve_node_host
 from ..utils.output import err_console
 from .tag import _parse_color_map
 
+# Most API requests a command sends at once when it acts on several items
+MAX_PARALLEL_REQUESTS = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -191,12 +198,10 @@ async def validate_resources(
         List of dicts with keys: id, node, status.
     """
     resources = await client.get_cluster_resources(resource_type="vm")
+    by_id = {r.get("vmid"): r for r in resources if r.get("type") == resource_type}
     result = []
     for rid in id_list:
-        resource = next(
-            (r for r in resources if r.get("vmid") == rid and r.get("type") == resource_type),
-            None,
-        )
+        resource = by_id.get(rid)
         if not resource:
             print_error(f"{label} {rid} not found")
             raise typer.Exit(1)
@@ -269,6 +274,43 @@ async def run_with_spinner(
     return upid
 
 
+async def gather_bounded(
+    items: Iterable[_T],
+    call: Callable[[_T], Awaitable[_R]],
+    on_error: Callable[[_T, PVECliError], None],
+) -> list[tuple[_T, _R]]:
+    """Run call(item) for every item, at most MAX_PARALLEL_REQUESTS at a time.
+
+    A PVECliError only fails its own item: it is passed to on_error once
+    every call is done. Any other exception is re-raised.
+
+    Args:
+        items: Items to act on.
+        call: Coroutine function sending the request(s) for one item.
+        on_error: Reports a failed item, e.g. with print_error.
+
+    Returns:
+        (item, result) pairs of the calls that succeeded, in item order.
+    """
+    items = list(items)
+    sem = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+
+    async def _one(item: _T) -> _R:
+        async with sem:
+            return await call(item)
+
+    results = await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
+    succeeded = []
+    for item, result in zip(items, results, strict=True):
+        if isinstance(result, PVECliError):
+            on_error(item, result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            succeeded.append((item, result))
+    return succeeded
+
+
 # ---------------------------------------------------------------------------
 # Tag commands
 # ---------------------------------------------------------------------------
@@ -764,7 +806,7 @@ async def shared_vnc(
         "ws_path": f"/api2/json/nodes/{node}/{api_type}/{resource_id}/vncwebsocket",
         "vncticket": vnc_data["ticket"],
         "pve_port": int(vnc_data["port"]),
-        "auth_headers": dict(client._headers),
+        "auth_headers": MappingProxyType(client._headers),
         "local_port": find_free_port(),
         "verify_ssl": profile_config.verify_ssl,
         "vnc_password": vnc_password,
@@ -2,6 +2,7 @@
 
 import asyncio
 import re
+from types import MappingProxyType
 from typing import Any
 
 import typer
@@ -3111,7 +3112,7 @@ async def ct_vnc(
                     "ws_path": f"/api2/json/nodes/{node}/lxc/{ctid}/vncwebsocket",
                     "vncticket": vnc_data["ticket"],
                     "pve_port": int(vnc_data["port"]),
-                    "auth_headers": dict(client._headers),
+                    "auth_headers": MappingProxyType(client._headers),
                     "local_port": find_free_port(),
                     "verify_ssl": profile_config.verify_ssl,
                     "vnc_password": vnc_data["ticket"],
@@ -3136,12 +3137,14 @@ async def ct_vnc(
         for ctid, ct_name, server_config in consoles:
             server = VNCProxyServer(**server_config)
             proc = subprocess.Popen(
-                [sys.executable, "-m", "src.vnc", json.dumps(server_config)],
-                stdin=subprocess.DEVNULL,
+                [sys.executable, "-m", "src.vnc"],
+                stdin=subprocess.PIPE,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 start_new_session=True,
             )
+            proc.stdin.write(json.dumps(server_config, default=dict).encode())
+            proc.stdin.close()
             open_browser_window(server.get_browser_url(), new_window=split)
             print_success(f"VNC console for CT {ctid} ({ct_name}) running in background (PID: {proc.pid})")
 
@@ -1,5 +1,9 @@
 """Node management commands."""
 
+import asyncio
+import heapq
+from types import MappingProxyType
+
 import typer
 from rich.panel import Panel
 
@@ -22,8 +26,7 @@ from ..utils import (
     print_warning,
 )
 from ..utils.helpers import async_to_sync, ordered_group
-from ..utils.menu import select_menu
-from ..utils.network import resolve_node_host
+from ..utils.network import find_free_port, resolve_node_host
 from ._shared import detect_connected_node, pick_node
 
 app = typer.Typer(
@@ -210,7 +213,6 @@ async def list_nodes(
                 disk_percent = (disk_used / disk_total) * 100 if disk_total else 0
 
                 uptime = node.get("uptime", 0)
-                uptime_str = f"{uptime // 86400}d {(uptime % 86400) // 3600}h"
 
                 rows.append({
                     "Node": (node.get("node", "unknown"), node.get("node", "unknown")),
@@ -220,7 +222,7 @@ async def list_nodes(
                                f"({format_percentage(mem_percent)})"),
                     "Disk": (disk_percent, f"{format_bytes(disk_used)} / {format_bytes(disk_total)} "
                              f"({format_percentage(disk_percent)})"),
-                    "Uptime": (uptime, uptime_str if uptime > 0 else "-"),
+                    "Uptime": (uptime, format_uptime(uptime) if uptime > 0 else "-"),
                 })
 
             table = build_ordered_table("Cluster Nodes", columns, rows, order)
@@ -254,19 +256,28 @@ async def show_node(
                 return
 
             if all_nodes:
-                for node_info in sorted(nodes, key=lambda n: n.get("node", "")):
-                    node_name = node_info.get("node", "unknown")
-                    ns = node_info.get("status", "unknown")
-                    status = await client.get_node_status(node_name)
-                    console.print(_render_node_panel(node_name, status, version, ns))
+                ordered = sorted(nodes, key=lambda n: n.get("node", "unknown"))
+                tasks = [
+                    _fetch_node_panel(client, idx, n.get("node", "unknown"), n.get("status", "unknown"), version)
+                    for idx, n in enumerate(ordered)
+                ]
+                # Print each panel as soon as it and all the ones before it are ready
+                ready: list[tuple[int, Panel]] = []
+                next_idx = 0
+                for fut in asyncio.as_completed(tasks):
+                    heapq.heappush(ready, await fut)
+                    while ready and ready[0][0] == next_idx:
+                        console.print(heapq.heappop(ready)[1])
+                        next_idx += 1
             else:
                 if not node:
                     node = await pick_node(client)
                     if node is None:
                         return
 
-                ns = next((n.get("status", "unknown") for n in nodes if n.get("node") == node), "unknown")
-                status = await client.get_node_status(node)
+                nodes_by_name = {n.get("node"): n for n in nodes}
+                ns = nodes_by_name.get(node, {}).get("status", "unknown")
+                status = await client.get_node_status(node) if ns == "online" else {}
                 console.print(_render_node_panel(node, status, version, ns))
 
     except PVECliError as e:
@@ -274,6 +285,14 @@ async def show_node(
         raise typer.Exit(1)
 
 
+async def _fetch_node_panel(
+    client: ProxmoxClient, idx: int, node: str, node_status: str, version: dict
+) -> tuple[int, Panel]:
+    """Fetch a node's status and render its panel, tagged with its display index."""
+    status = await client.get_node_status(node) if node_status == "online" else {}
+    return idx, _render_node_panel(node, status, version, node_status)
+
+
 def _render_node_panel(node: str, status: dict, version: dict, node_status: str = "unknown") -> Panel:
     """Build a Rich Panel for a single node."""
     lines = []
@@ -282,6 +301,12 @@ def _render_node_panel(node: str, status: dict, version: dict, node_status: str
     lines.append("[bold]── General ──[/bold]")
     status_str = f"[green]{node_status}[/green]" if node_status == "online" else f"[red]{node_status}[/red]"
     lines.append(f"[bold]Status:[/bold]     {status_str}")
+
+    # Offline nodes report zeroed metrics: skip the detail sections
+    if node_status != "online":
+        lines.append("[dim]Node offline — detailed metrics unavailable[/dim]")
+        return Panel("\n".join(lines), title=f"Node: {node}", border_style="red")
+
     lines.append(f"[bold]Uptime:[/bold]     {format_uptime(status.get('uptime', 0))}")
     lines.append(f"[bold]PVE:[/bold]        {version.get('version', '?')} (release {version.get('release', '?')})")
 
@@ -341,10 +366,6 @@ async def node_vnc(
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """Open authenticated VNC shell(s) for one or more nodes."""
-    from ..utils import open_browser_window, print_success
-    from ..utils.network import find_free_port
-    from ..vnc.server import VNCProxyServer
-
     config_manager = ConfigManager()
 
     try:
@@ -371,11 +392,12 @@ async def node_vnc(
                 no_background = False
 
             nodes = await client.get_nodes()
+            nodes_by_name = {n.get("node"): n for n in nodes}
             host = resolve_node_host(profile_config)
 
             consoles = []
             for node_name in node_list:
-                node_info = next((n for n in nodes if n.get("node") == node_name), None)
+                node_info = nodes_by_name.get(node_name)
 
                 if not node_info:
                     print_error(f"Node '{node_name}' not found")
@@ -394,7 +416,7 @@ async def node_vnc(
                     "ws_path": f"/api2/json/nodes/{node_name}/vncwebsocket",
                     "vncticket": vnc_data["ticket"],
                     "pve_port": int(vnc_data["port"]),
-                    "auth_headers": dict(client._headers),
+                    "auth_headers": MappingProxyType(client._headers),
                     "local_port": find_free_port(),
                     "verify_ssl": profile_config.verify_ssl,
                     "vnc_password": vnc_data["ticket"],
@@ -403,6 +425,10 @@ async def node_vnc(
         if not consoles:
             raise typer.Exit(1)
 
+        # Only load the websocket/TLS proxy once a console is actually needed
+        from ..utils import open_browser_window
+        from ..vnc.server import VNCProxyServer
+
         if no_background:
             node_name, server_config = consoles[0]
             server = VNCProxyServer(**server_config)
@@ -417,13 +443,17 @@ async def node_vnc(
 
             for node_name, server_config in consoles:
                 server = VNCProxyServer(**server_config)
+                # Config goes through stdin so auth headers never show up in
+                # the process table
                 proc = subprocess.Popen(
-                    [sys.executable, "-m", "src.vnc", json.dumps(server_config)],
-                    stdin=subprocess.DEVNULL,
+                    [sys.executable, "-m", "src.vnc"],
+                    stdin=subprocess.PIPE,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                     start_new_session=True,
                 )
+                proc.stdin.write(json.dumps(server_config, default=dict).encode())
+                proc.stdin.close()
                 open_browser_window(server.get_browser_url(), new_window=split)
                 print_success(f"VNC shell for node '{node_name}' running in background (PID: {proc.pid})")
 
@@ -443,8 +473,6 @@ async def node_ssh(
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
 ) -> None:
     """SSH into a Proxmox node."""
-    from ..ssh import build_ssh_command, exec_ssh
-
     config_manager = ConfigManager()
 
     try:
@@ -461,6 +489,8 @@ async def node_ssh(
         ssh_port = port or profile_config.ssh_port
         ssh_key = key or profile_config.ssh_key
 
+        from ..ssh import build_ssh_command, exec_ssh
+
         args = build_ssh_command(host, ssh_user, ssh_port, ssh_key, command=command)
         console.print(f"[dim]Connecting to {ssh_user}@{host}...[/dim]")
         exec_ssh(args)
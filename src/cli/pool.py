@@ -1,6 +1,9 @@
 """Pool management commands."""
 
 import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import typer
@@ -25,17 +28,70 @@ from ..utils import (
 )
 from ..utils.helpers import async_to_sync, ordered_group
 from ..utils.menu import multi_select_menu, select_menu
-from ._shared import shared_usage
+from ._shared import gather_bounded, shared_usage
+
+# Options shared by every pool command, built once at import
+_PROFILE_OPTION = typer.Option(None, "--profile", "-p", help="Profile to use")
+_YES_OPTION = typer.Option(False, "--yes", "-y", help="Skip confirmation")
 
 app = typer.Typer(help="Manage resource pools", no_args_is_help=True, cls=ordered_group(["add", "remove", "content", "export", "import", "list", "usage", "info"]))
 content_app = typer.Typer(help="Manage pool members (VMs/CTs)", no_args_is_help=True)
 app.add_typer(content_app, name="content")
 
 
+_POOL_ID_SEP = re.compile(r"[,;]")
+
+
+def _parse_csv_ints(raw: str) -> list[int]:
+    """Parse a comma-separated ID list. Raises ValueError on a non-integer."""
+    if "," not in raw:
+        value = raw.strip()
+        return [int(value)] if value else []
+    return [int(v) for v in (p.strip() for p in raw.split(",")) if v]
+
+
+def _parse_csv_strs(raw: str) -> list[str]:
+    """Parse a comma- or semicolon-separated name list, dropping blanks."""
+    if "," not in raw and ";" not in raw:
+        value = raw.strip()
+        return [value] if value else []
+    return [v for v in (p.strip() for p in _POOL_ID_SEP.split(raw)) if v]
+
+
+@contextmanager
+def _spinner(desc: str) -> Iterator[None]:
+    """Show a single indeterminate spinner while the block runs."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task(description=desc, total=None)
+        yield
+
+
+def _sorted_pool_ids(pools: list[dict]) -> list[str]:
+    """Pool IDs of a /pools listing, sorted case-insensitively for menus."""
+    return sorted((p["poolid"] for p in pools if p.get("poolid")), key=str.lower)
+
+
+def _group_members(members: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """Split pool members into (VMs, containers, storages) in a single pass."""
+    vms: list[dict] = []
+    cts: list[dict] = []
+    storages: list[dict] = []
+    buckets = {"qemu": vms, "lxc": cts, "storage": storages}
+    for m in members:
+        bucket = buckets.get(m.get("type"))
+        if bucket is not None:
+            bucket.append(m)
+    return vms, cts, storages
+
+
 @app.command("list")
 @async_to_sync
 async def list_pools(
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
     order: str = typer.Option(None, "--order", "-o", help="Sort by column (moved to first position), e.g. pool, comment"),
     json_output: bool = JSON_OPTION,
 ) -> None:
@@ -47,16 +103,10 @@ async def list_pools(
         profile_name = profile or config_manager.get().default_profile
 
         async with ProxmoxClient(profile_config) as client:
-            pools = await client.get("/pools")
-
-            # Handle response format
-            if isinstance(pools, dict) and "data" in pools:
-                pools = pools.get("data", [])
-            elif not isinstance(pools, list):
-                pools = []
+            pools = await client.get_pools() or []
 
             # Sort by poolid (default order)
-            pools = sorted(pools, key=lambda x: x.get("poolid", ""))
+            pools = sorted(pools, key=lambda p: p.get("poolid", ""))
 
             # JSON first: raw API entries, empty list included, no Rich output
             if json_output:
@@ -71,13 +121,12 @@ async def list_pools(
                 ("Pool ID", {"style": "cyan"}),
                 ("Comment", {}),
             ]
-            rows = [
-                {
-                    "Pool ID": (pool.get("poolid", "-"), pool.get("poolid", "-")),
-                    "Comment": (pool.get("comment", ""), pool.get("comment", "")),
-                }
-                for pool in pools
-            ]
+            rows = []
+            add_row = rows.append
+            for pool in pools:
+                poolid = pool.get("poolid", "-")
+                comment = pool.get("comment", "")
+                add_row({"Pool ID": (poolid, poolid), "Comment": (comment, comment)})
 
             table = build_ordered_table("Resource Pools", columns, rows, order)
             if table is None:
@@ -93,7 +142,7 @@ async def list_pools(
 @async_to_sync
 async def show_pool(
     poolid: str = typer.Argument(None, help="Pool ID"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
     json_output: bool = JSON_OPTION,
 ) -> None:
     """Show detailed information about a pool."""
@@ -108,16 +157,9 @@ async def show_pool(
                 if json_output:
                     print_error("--json requires a pool ID (no interactive menu in JSON mode)")
                     raise typer.Exit(1)
-                pools = await client.get_pools()
-                if not pools:
-                    print_info("No pools found")
-                    return
-                pool_ids = sorted(p.get("poolid", "") for p in pools if p.get("poolid"))
-                idx = select_menu(pool_ids, "  Select pool:")
-                if idx is None:
-                    print_cancelled()
+                poolid = await _pick_pool(client)
+                if poolid is None:
                     return
-                poolid = pool_ids[idx]
 
             pool_data = await client.get_pool(poolid)
 
@@ -140,44 +182,30 @@ async def show_pool(
             if comment:
                 lines.append(f"[bold]Comment:[/bold]     {comment}")
 
-            # Group members by type
-            vms = [m for m in members if m.get("type") == "qemu"]
-            cts = [m for m in members if m.get("type") == "lxc"]
-            storages = [m for m in members if m.get("type") == "storage"]
+            vms, cts, storages = _group_members(members)
 
             if vms:
                 lines.append("")
                 lines.append(f"[bold]VMs ({len(vms)}):[/bold]")
-                for vm in sorted(vms, key=lambda x: x.get("vmid", 0)):
-                    vmid = vm.get("vmid", "-")
-                    name = vm.get("name", "")
-                    node = vm.get("node", "")
-                    display = f"  {vmid}"
-                    if name:
-                        display += f" - {name}"
-                    if node:
-                        display += f" (node: {node})"
-                    lines.append(display)
+                rows = sorted((m.get("vmid", 0), m.get("name", ""), m.get("node", "")) for m in vms)
+                lines.extend(
+                    f"  {vmid}{f' - {name}' if name else ''}{f' (node: {node})' if node else ''}"
+                    for vmid, name, node in rows
+                )
 
             if cts:
                 lines.append("")
                 lines.append(f"[bold]Containers ({len(cts)}):[/bold]")
-                for ct in sorted(cts, key=lambda x: x.get("vmid", 0)):
-                    vmid = ct.get("vmid", "-")
-                    name = ct.get("name", "")
-                    node = ct.get("node", "")
-                    display = f"  {vmid}"
-                    if name:
-                        display += f" - {name}"
-                    if node:
-                        display += f" (node: {node})"
-                    lines.append(display)
+                rows = sorted((m.get("vmid", 0), m.get("name", ""), m.get("node", "")) for m in cts)
+                lines.extend(
+                    f"  {vmid}{f' - {name}' if name else ''}{f' (node: {node})' if node else ''}"
+                    for vmid, name, node in rows
+                )
 
             if storages:
                 lines.append("")
                 lines.append(f"[bold]Storages ({len(storages)}):[/bold]")
-                for storage in sorted(storages, key=lambda x: x.get("storage", "")):
-                    storage_id = storage.get("storage", "-")
+                for storage_id in sorted(m.get("storage", "-") for m in storages):
                     lines.append(f"  {storage_id}")
 
             if not vms and not cts and not storages:
@@ -200,7 +228,7 @@ async def show_pool(
 @async_to_sync
 async def pool_usage(
     poolid: str = typer.Argument(None, help="Pool ID"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
     no_storage: bool = typer.Option(False, "--no-storage", help="Skip the storage scan (faster)"),
     storage: str = typer.Option(None, "--storage", help="Only scan this storage for guest disks"),
     json_output: bool = JSON_OPTION,
@@ -217,16 +245,9 @@ async def pool_usage(
                 if json_output:
                     print_error("--json requires a pool ID (no interactive menu in JSON mode)")
                     raise typer.Exit(1)
-                pools = await client.get_pools()
-                if not pools:
-                    print_info("No pools found")
-                    return
-                pool_ids = sorted(p.get("poolid", "") for p in pools if p.get("poolid"))
-                idx = select_menu(pool_ids, "  Select pool:")
-                if idx is None:
-                    print_cancelled()
+                poolid = await _pick_pool(client)
+                if poolid is None:
                     return
-                poolid = pool_ids[idx]
 
             await shared_usage(
                 client,
@@ -252,7 +273,7 @@ async def pool_usage(
 @async_to_sync
 async def export_pools(
     output: str = typer.Option("pools.json", "--output", "-o", help="Output file path"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
 ) -> None:
     """Export all pools to a JSON file."""
     config_manager = ConfigManager()
@@ -261,11 +282,7 @@ async def export_pools(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            pools = await client.get("/pools")
-            if isinstance(pools, dict) and "data" in pools:
-                pools = pools.get("data", [])
-            elif not isinstance(pools, list):
-                pools = []
+            pools = await client.get_pools() or []
 
             if not pools:
                 print_warning("No pools found to export")
@@ -295,7 +312,7 @@ async def export_pools(
 async def import_pools(
     file: str = typer.Argument("pools.json", help="JSON file to import"),
     force: bool = typer.Option(False, "--force", "-f", is_flag=True, help="Skip existing pools without warning"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
 ) -> None:
     """Import pools from a JSON file."""
     config_manager = ConfigManager()
@@ -317,11 +334,7 @@ async def import_pools(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            existing_pools = await client.get("/pools")
-            if isinstance(existing_pools, dict) and "data" in existing_pools:
-                existing_pools = existing_pools.get("data", [])
-            elif not isinstance(existing_pools, list):
-                existing_pools = []
+            existing_pools = await client.get_pools() or []
             existing_ids = {p.get("poolid", "") for p in existing_pools}
 
             created = 0
@@ -376,7 +389,7 @@ async def import_pools(
 @async_to_sync
 async def add_pool(
     poolid: str = typer.Argument(None, help="Pool ID(s) - single or comma/semicolon-separated (e.g., dev or dev,staging,prod)"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
     comment: str = typer.Option(None, "--comment", "-c", help="Pool description"),
 ) -> None:
     """Create one or more resource pools."""
@@ -386,8 +399,7 @@ async def add_pool(
         pool_ids: list[str] = []
 
         if poolid:
-            import re
-            pool_ids = [p.strip() for p in re.split(r"[,;]", poolid) if p.strip()]
+            pool_ids = _parse_csv_strs(poolid)
         else:
             # Interactive mode: ask for pool names in a loop
             while True:
@@ -406,21 +418,21 @@ async def add_pool(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            for pid in pool_ids:
+            async def _create(pid: str) -> None:
                 data: dict[str, str] = {"poolid": pid}
                 if comment:
                     data["comment"] = comment
-
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    progress.add_task(description=f"Creating pool '{pid}'...", total=None)
-                    await client.post("/pools", data=data)
-
+                await client.post("/pools", data=data)
                 print_success(f"Pool '{pid}' created successfully")
 
+            desc = f"Creating pool '{pool_ids[0]}'..." if len(pool_ids) == 1 else f"Creating {len(pool_ids)} pools..."
+            with _spinner(desc):
+                created = await gather_bounded(
+                    pool_ids, _create, lambda pid, e: print_error(f"Failed to create pool '{pid}': {e}")
+                )
+            if len(created) < len(pool_ids):
+                raise typer.Exit(1)
+
     except KeyboardInterrupt:
         console.print()
         print_cancelled()
@@ -433,8 +445,8 @@ async def add_pool(
 @async_to_sync
 async def remove_pool(
     poolid: str = typer.Argument(None, help="Pool ID"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+    profile: str = _PROFILE_OPTION,
+    yes: bool = _YES_OPTION,
     force: bool = typer.Option(False, "--force", "-f", help="Delete even if pool contains resources"),
 ) -> None:
     """Delete one or more resource pools."""
@@ -444,19 +456,13 @@ async def remove_pool(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            pools = await client.get("/pools")
-            if isinstance(pools, dict) and "data" in pools:
-                pools = pools.get("data", [])
-            elif not isinstance(pools, list):
-                pools = []
-
-            if not pools:
-                print_warning("No pools found")
-                return
-
-            pool_ids = sorted(p.get("poolid", "") for p in pools)
-
             if poolid is None:
+                pools = await client.get_pools() or []
+                if not pools:
+                    print_warning("No pools found")
+                    return
+
+                pool_ids = _sorted_pool_ids(pools)
                 sel = multi_select_menu(pool_ids, "  Pools to remove (Space to toggle, Enter to confirm):")
                 if sel is None:
                     print_cancelled()
@@ -471,10 +477,14 @@ async def remove_pool(
             # Check each pool for members
             blocked = []
             empty = []
-            for pid in selected_pools:
-                pool_data = await client.get(f"/pools/{pid}")
-                if isinstance(pool_data, dict) and "data" in pool_data:
-                    pool_data = pool_data.get("data", {})
+            results = await gather_bounded(
+                selected_pools,
+                client.get_pool,
+                lambda pid, e: print_error(f"Failed to read pool '{pid}': {e}"),
+            )
+            # A pool that could not be read is left alone, the others proceed
+            unreadable = len(results) < len(selected_pools)
+            for pid, pool_data in results:
                 members = pool_data.get("members", [])
                 if members and not force:
                     blocked.append((pid, members))
@@ -483,9 +493,7 @@ async def remove_pool(
 
             if blocked:
                 for pid, members in blocked:
-                    vms = [m for m in members if m.get("type") == "qemu"]
-                    cts = [m for m in members if m.get("type") == "lxc"]
-                    storages = [m for m in members if m.get("type") == "storage"]
+                    vms, cts, storages = _group_members(members)
                     parts = []
                     if vms:
                         parts.append(f"{len(vms)} VM(s)")
@@ -496,6 +504,8 @@ async def remove_pool(
                     print_warning(f"Pool '{pid}' contains {', '.join(parts)} - use --force to delete anyway")
 
             if not empty:
+                if unreadable:
+                    raise typer.Exit(1)
                 return
 
             if not yes:
@@ -507,21 +517,21 @@ async def remove_pool(
                     print_cancelled()
                     return
 
-            deleted = 0
-            for pid in empty:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    progress.add_task(description=f"Deleting pool '{pid}'...", total=None)
-                    await client.delete(f"/pools/{pid}")
-                deleted += 1
-
-            if deleted == 1:
-                print_success(f"Pool '{empty[0]}' deleted successfully")
-            else:
-                print_success(f"{deleted} pools deleted: {', '.join(empty)}")
+            desc = f"Deleting pool '{empty[0]}'..." if len(empty) == 1 else f"Deleting {len(empty)} pools..."
+            with _spinner(desc):
+                results = await gather_bounded(
+                    empty,
+                    lambda pid: client.delete(f"/pools/{pid}"),
+                    lambda pid, e: print_error(f"Failed to delete pool '{pid}': {e}"),
+                )
+            deleted = [pid for pid, _ in results]
+
+            if len(deleted) == 1:
+                print_success(f"Pool '{deleted[0]}' deleted successfully")
+            elif deleted:
+                print_success(f"{len(deleted)} pools deleted: {', '.join(deleted)}")
+            if unreadable or len(deleted) < len(empty):
+                raise typer.Exit(1)
 
     except KeyboardInterrupt:
         console.print()
@@ -534,9 +544,13 @@ async def remove_pool(
 # ── pool content add / remove (manage pool members) ─────────────────────
 
 
-def _format_resource(r: dict) -> str:
-    """Format a resource dict as 'TYPE VMID (name)'."""
-    rtype = "VM" if r.get("type") == "qemu" else "CT"
+def _format_resource(r: dict, rtype: str | None = None) -> str:
+    """Format a resource dict as 'TYPE VMID (name)'.
+
+    rtype replaces the VM/CT label derived from the resource type, e.g. with
+    the label of an added/removed item.
+    """
+    rtype = rtype or ("VM" if r.get("type") == "qemu" else "CT")
     vmid = r.get("vmid", "?")
     name = r.get("name", "")
     return f"{rtype} {vmid} ({name})" if name else f"{rtype} {vmid}"
@@ -544,17 +558,12 @@ def _format_resource(r: dict) -> str:
 
 async def _pick_pool(client: ProxmoxClient) -> str | None:
     """Fetch pools and show a single-select menu. Returns poolid or None."""
-    pools = await client.get("/pools")
-    if isinstance(pools, dict) and "data" in pools:
-        pools = pools.get("data", [])
-    elif not isinstance(pools, list):
-        pools = []
-
+    pools = await client.get_pools() or []
     if not pools:
         print_warning("No pools found")
         return None
 
-    pool_ids = sorted(p.get("poolid", "") for p in pools)
+    pool_ids = _sorted_pool_ids(pools)
     idx = select_menu(pool_ids, "  Select pool:")
     if idx is None:
         print_cancelled()
@@ -567,7 +576,7 @@ async def _pick_pool(client: ProxmoxClient) -> str | None:
 async def content_add(
     poolid: str = typer.Argument(None, help="Pool ID"),
     vmids: str = typer.Argument(None, help="VM or Container ID(s) (comma-separated, e.g. 100,101,102)"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
+    profile: str = _PROFILE_OPTION,
     force: bool = typer.Option(False, "--force", "-f", help="Allow moving VM/CT from another pool"),
 ) -> None:
     """Add one or more VMs or Containers to a pool.
@@ -587,13 +596,11 @@ async def content_add(
                 if poolid is None:
                     return
 
-            # Get all resources
-            resources = await client.get_cluster_resources(resource_type="vm")
-
             if vmids is None:
+                resources = await client.get_cluster_resources(resource_type="vm")
                 # Filter resources not already in any pool
                 available = [r for r in resources if not r.get("pool")]
-                available = sorted(available, key=lambda r: r.get("vmid", 0))
+                available.sort(key=lambda r: r.get("vmid", 0))
 
                 if not available:
                     print_warning(f"No VMs/CTs available to add to pool '{poolid}'")
@@ -616,7 +623,7 @@ async def content_add(
             else:
                 # Parse input VMIDs (comma-separated)
                 try:
-                    vmid_list = [int(v.strip()) for v in vmids.split(",") if v.strip()]
+                    vmid_list = _parse_csv_ints(vmids)
                 except ValueError:
                     print_error("Invalid VMID format. Use comma-separated numbers: 100,101,102")
                     raise typer.Exit(1)
@@ -625,10 +632,13 @@ async def content_add(
                     print_error("No valid VMIDs provided")
                     raise typer.Exit(1)
 
+                # One cached listing labels the IDs and weeds out unknown ones
+                resources = await client.get_cluster_resources(resource_type="vm")
+                by_vmid = {r.get("vmid"): r for r in resources}
                 added_items = []
                 not_found = []
                 for vmid in vmid_list:
-                    resource = next((r for r in resources if r.get("vmid") == vmid), None)
+                    resource = by_vmid.get(vmid)
                     if resource:
                         rtype = "VM" if resource.get("type") == "qemu" else "Container"
                         added_items.append({"vmid": vmid, "type": rtype, "name": resource.get("name", "")})
@@ -651,17 +661,12 @@ async def content_add(
                 data["allow-move"] = 1
 
             try:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console,
-                ) as progress:
-                    if len(added_items) == 1:
-                        item = added_items[0]
-                        desc = f"Adding {item['type']} {item['vmid']} to pool '{poolid}'..."
-                    else:
-                        desc = f"Adding {len(added_items)} items to pool '{poolid}'..."
-                    progress.add_task(description=desc, total=None)
+                if len(added_items) == 1:
+                    item = added_items[0]
+                    desc = f"Adding {item['type']} {item['vmid']} to pool '{poolid}'..."
+                else:
+                    desc = f"Adding {len(added_items)} items to pool '{poolid}'..."
+                with _spinner(desc):
                     await client.put(f"/pools/{poolid}", data=data)
             except PVECliError as e:
                 error_msg = str(e)
@@ -675,18 +680,10 @@ async def content_add(
             # Success messages
             if len(added_items) == 1:
                 item = added_items[0]
-                success_msg = f"{item['type']} {item['vmid']}"
-                if item['name']:
-                    success_msg += f" ({item['name']})"
-                success_msg += f" added to pool '{poolid}'"
-                print_success(success_msg)
+                print_success(f"{_format_resource(item, item['type'])} added to pool '{poolid}'")
             else:
                 print_success(f"{len(added_items)} items added to pool '{poolid}':")
-                for item in added_items:
-                    display = f"  - {item['type']} {item['vmid']}"
-                    if item['name']:
-                        display += f" ({item['name']})"
-                    console.print(display)
+                console.print("\n".join(f"  - {_format_resource(item, item['type'])}" for item in added_items))
 
     except KeyboardInterrupt:
         console.print()
@@ -701,8 +698,8 @@ async def content_add(
 async def content_remove(
     poolid: str = typer.Argument(None, help="Pool ID"),
     vmids: str = typer.Argument(None, help="VM or Container ID(s) (comma-separated, e.g. 100,101,102)"),
-    profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+    profile: str = _PROFILE_OPTION,
+    yes: bool = _YES_OPTION,
 ) -> None:
     """Remove one or more VMs or Containers from a pool."""
     config_manager = ConfigManager()
@@ -718,9 +715,7 @@ async def content_remove(
                     return
 
             # Fetch pool members
-            pool_data = await client.get(f"/pools/{poolid}")
-            if isinstance(pool_data, dict) and "data" in pool_data:
-                pool_data = pool_data.get("data", {})
+            pool_data = await client.get_pool(poolid)
             members = [m for m in pool_data.get("members", []) if m.get("type") in ("qemu", "lxc")]
             members = sorted(members, key=lambda m: m.get("vmid", 0))
 
@@ -745,7 +740,7 @@ async def content_remove(
                     removed_items.append({"vmid": m.get("vmid"), "type": rtype, "name": m.get("name", "")})
             else:
                 try:
-                    vmid_list = [int(v.strip()) for v in vmids.split(",") if v.strip()]
+                    vmid_list = _parse_csv_ints(vmids)
                 except ValueError:
                     print_error("Invalid VMID format. Use comma-separated numbers: 100,101,102")
                     raise typer.Exit(1)
@@ -777,10 +772,7 @@ async def content_remove(
             if not yes:
                 if len(removed_items) == 1:
                     item = removed_items[0]
-                    msg = f"Remove {item['type']} {item['vmid']}"
-                    if item['name']:
-                        msg += f" ({item['name']})"
-                    msg += f" from pool '{poolid}'?"
+                    msg = f"Remove {_format_resource(item, item['type'])} from pool '{poolid}'?"
                 else:
                     msg = f"Remove {len(removed_items)} items from pool '{poolid}'?"
                 if not confirm(msg):
@@ -793,34 +785,21 @@ async def content_remove(
                 "delete": 1
             }
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                if len(removed_items) == 1:
-                    item = removed_items[0]
-                    desc = f"Removing {item['type']} {item['vmid']} from pool '{poolid}'..."
-                else:
-                    desc = f"Removing {len(removed_items)} items from pool '{poolid}'..."
-                progress.add_task(description=desc, total=None)
+            if len(removed_items) == 1:
+                item = removed_items[0]
+                desc = f"Removing {item['type']} {item['vmid']} from pool '{poolid}'..."
+            else:
+                desc = f"Removing {len(removed_items)} items from pool '{poolid}'..."
+            with _spinner(desc):
                 await client.put(f"/pools/{poolid}", data=data)
 
             # Success messages
             if len(removed_items) == 1:
                 item = removed_items[0]
-                success_msg = f"{item['type']} {item['vmid']}"
-                if item['name']:
-                    success_msg += f" ({item['name']})"
-                success_msg += f" removed from pool '{poolid}'"
-                print_success(success_msg)
+                print_success(f"{_format_resource(item, item['type'])} removed from pool '{poolid}'")
             else:
                 print_success(f"{len(removed_items)} items removed from pool '{poolid}':")
-                for item in removed_items:
-                    display = f"  - {item['type']} {item['vmid']}"
-                    if item['name']:
-                        display += f" ({item['name']})"
-                    console.print(display)
+                console.print("\n".join(f"  - {_format_resource(item, item['type'])}" for item in removed_items))
 
     except KeyboardInterrupt:
         console.print()
@@ -12,17 +12,25 @@ from ..config import ConfigManager
 from ..utils import JSON_OPTION, build_ordered_table, confirm, console, emit_json, format_bytes, format_percentage, print_cancelled, print_error, print_info, print_success, print_warning, prompt
 from ..utils.helpers import async_to_sync, ordered_group
 from ..utils.menu import multi_select_menu, select_menu
-from ._shared import pick_node
+from ._shared import MAX_PARALLEL_REQUESTS, gather_bounded, pick_node
 
 app = typer.Typer(help="Manage storage", no_args_is_help=True, cls=ordered_group(["config", "content", "list", "show"]))
 content_app = typer.Typer(help="Manage storage content", no_args_is_help=True)
 app.add_typer(content_app, name="content")
 
 
-async def _pick_storage(client: ProxmoxClient, node: str) -> str | None:
-    """Interactive single-select for a storage on a node. Returns storage id or None."""
+def _sorted_storage_ids(storages: list[dict]) -> list[str]:
+    """Sorted IDs of a /storage listing, entries without an ID skipped."""
+    storage_ids = [s["storage"] for s in storages if s.get("storage")]
+    storage_ids.sort()
+    return storage_ids
+
+
+async def _pick_storage(client: ProxmoxClient, node: str) -> tuple[str, dict] | None:
+    """Interactive single-select for a storage on a node. Returns (storage id, storage entry) or None."""
     storages = await client.get_storage_list(node)
-    storage_ids = sorted(s.get("storage", "") for s in storages if s.get("storage"))
+    by_id = {s["storage"]: s for s in storages if s.get("storage")}
+    storage_ids = sorted(by_id)
     if not storage_ids:
         print_info(f"No storages found on node '{node}'")
         return None
@@ -30,20 +38,95 @@ async def _pick_storage(client: ProxmoxClient, node: str) -> str | None:
     if idx is None:
         print_cancelled()
         return None
-    return storage_ids[idx]
+    return storage_ids[idx], by_id[storage_ids[idx]]
+
 
+async def _resolve_node_storage(
+    client: ProxmoxClient, node: str | None, storage: str | None
+) -> tuple[str, str, dict | None] | None:
+    """Resolve node and storage interactively if not provided.
 
-async def _resolve_node_storage(client: ProxmoxClient, node: str | None, storage: str | None) -> tuple[str, str] | None:
-    """Resolve node and storage interactively if not provided. Returns (node, storage) or None on cancel."""
+    Returns (node, storage, entry) or None on cancel. The entry is the
+    node's /storage listing item when the storage came from the picker
+    (type, content, ...), None when it was given on the command line.
+    """
     if not node:
         node = await pick_node(client)
         if node is None:
             return None
+    entry = None
     if not storage:
-        storage = await _pick_storage(client, node)
-        if storage is None:
+        picked = await _pick_storage(client, node)
+        if picked is None:
             return None
-    return node, storage
+        storage, entry = picked
+    return node, storage, entry
+
+
+# (active, enabled) -> (sort value, rendered cell)
+_STORAGE_STATUS = {
+    (True, True): ("active", "[green]active[/green]"),
+    (False, True): ("inactive", "[yellow]inactive[/yellow]"),
+    (True, False): ("disabled", "[red]disabled[/red]"),
+    (False, False): ("disabled", "[red]disabled[/red]"),
+}
+
+
+def _storage_status(storage: dict) -> tuple[str, str]:
+    """Status of a storage entry as (plain value, Rich-markup string)."""
+    return _STORAGE_STATUS[bool(storage.get("active")), bool(storage.get("enabled", True))]
+
+
+_STORAGE_COLUMNS = [
+    ("Storage", {"style": "cyan"}),
+    ("Type", {}),
+    ("Content", {}),
+    ("Status", {}),
+    ("Total", {"justify": "right"}),
+    ("Used", {"justify": "right"}),
+    ("Available", {"justify": "right"}),
+    ("Usage %", {"justify": "right"}),
+]
+
+
+def _storage_json_item(storage: dict, node: str) -> dict:
+    """Raw /storage entry with its node and the usage ratio as a real percentage (0.0 when total is 0)."""
+    item = dict(storage)
+    item["node"] = node
+    total = storage.get("total") or 0
+    used = storage.get("used") or 0
+    item["used_percent"] = (used / total * 100) if total else 0.0
+    return item
+
+
+def _storage_row(storage: dict, node: str) -> dict:
+    """Build a build_ordered_table row for one storage entry.
+
+    The "Node" cell is always filled, it only shows when the column is.
+    """
+    get = storage.get
+    status_val, status = _storage_status(storage)
+
+    sid, stype, content = get("storage", "-"), get("type", "-"), get("content", "-")
+    total, used, avail = get("total", 0), get("used", 0), get("avail", 0)
+    if total:
+        used_pct = used / total * 100
+        sizes = (format_bytes(total), format_bytes(used), format_bytes(avail), format_percentage(used_pct))
+    else:
+        used_pct = -1.0
+        sizes = ("-", "-", "-", "-")
+
+    return {
+        "Node": (node, node),
+        "Storage": (sid, sid),
+        "Type": (stype, stype),
+        "Content": (content, content),
+        "Status": (status_val, status),
+        "Total": (total, sizes[0]),
+        "Used": (used, sizes[1]),
+        "Available": (avail, sizes[2]),
+        "Usage %": (used_pct, sizes[3]),
+    }
 
 
 # ── storage list ─────────────────────────────────────────────────────────
@@ -65,82 +148,44 @@ async def list_storage(
         profile_name = profile or config_manager.get().default_profile
 
         async with ProxmoxClient(profile_config) as client:
+            # Each storage is converted to its output form (JSON item or table
+            # row) as soon as its node answers, the raw entries are not kept.
+            convert = _storage_json_item if json_output else _storage_row
             if node:
-                storage_list = await client.get_storage_list(node)
+                items = [convert(s, node) for s in await client.get_storage_list(node)]
                 title = f"Storage on {node}"
             else:
                 nodes = await client.get_nodes()
-                storage_list = []
-                for n in nodes:
-                    node_storage = await client.get_storage_list(n.get("node"))
-                    for s in node_storage:
-                        s["_node"] = n.get("node")
-                    storage_list.extend(node_storage)
+                node_names = [n.get("node") for n in nodes]
+                sem = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+
+                async def _node_items(idx: int, name: str) -> tuple[int, list]:
+                    try:
+                        async with sem:
+                            node_storage = await client.get_storage_list(name)
+                    except PVECliError as e:
+                        print_warning(f"Could not list storage on node '{name}': {e}")
+                        return idx, []
+                    return idx, [convert(s, name) for s in node_storage]
+
+                per_node: list[list] = [[] for _ in node_names]
+                for fut in asyncio.as_completed([_node_items(i, nn) for i, nn in enumerate(node_names)]):
+                    idx, node_items = await fut
+                    per_node[idx] = node_items
+                items = [item for node_items in per_node for item in node_items]
                 title = "Cluster Storage"
 
             if json_output:
-                # Raw /storage entries, the internal "_node" key exposed as "node"
-                # and the usage ratio as a real percentage (0.0 when total is 0).
-                payload = []
-                for storage in storage_list:
-                    item = {k: v for k, v in storage.items() if k != "_node"}
-                    item["node"] = storage.get("_node") or node
-                    total = storage.get("total") or 0
-                    used = storage.get("used") or 0
-                    item["used_percent"] = (used / total * 100) if total else 0.0
-                    payload.append(item)
-                emit_json({"profile": profile_name, "node": node, "storages": payload})
+                emit_json({"profile": profile_name, "node": node, "storages": items})
                 return
 
-            if not storage_list:
+            if not items:
                 print_info("No storage found")
                 return
 
-            columns = []
-            if not node:
-                columns.append(("Node", {"style": "cyan"}))
-            columns.extend([
-                ("Storage", {"style": "cyan"}),
-                ("Type", {}),
-                ("Content", {}),
-                ("Status", {}),
-                ("Total", {"justify": "right"}),
-                ("Used", {"justify": "right"}),
-                ("Available", {"justify": "right"}),
-                ("Usage %", {"justify": "right"}),
-            ])
-
-            rows = []
-            for storage in storage_list:
-                active = storage.get("active", False)
-                enabled = storage.get("enabled", True)
-                if active and enabled:
-                    status_val, status = "active", "[green]active[/green]"
-                elif enabled:
-                    status_val, status = "inactive", "[yellow]inactive[/yellow]"
-                else:
-                    status_val, status = "disabled", "[red]disabled[/red]"
-
-                total = storage.get("total", 0)
-                used = storage.get("used", 0)
-                avail = storage.get("avail", 0)
-                used_pct = (used / total * 100) if total else -1.0
-
-                row = {
-                    "Storage": (storage.get("storage", "-"), storage.get("storage", "-")),
-                    "Type": (storage.get("type", "-"), storage.get("type", "-")),
-                    "Content": (storage.get("content", "-"), storage.get("content", "-")),
-                    "Status": (status_val, status),
-                    "Total": (total, format_bytes(total) if total else "-"),
-                    "Used": (used, format_bytes(used) if total else "-"),
-                    "Available": (avail, format_bytes(avail) if total else "-"),
-                    "Usage %": (used_pct, format_percentage(used_pct) if total else "-"),
-                }
-                if not node:
-                    row["Node"] = (storage.get("_node", "-"), storage.get("_node", "-"))
-                rows.append(row)
-
-            table = build_ordered_table(title, columns, rows, order)
+            columns = _STORAGE_COLUMNS if node else [("Node", {"style": "cyan"}), *_STORAGE_COLUMNS]
+
+            table = build_ordered_table(title, columns, items, order)
             if table is None:
                 raise typer.Exit(1)
             console.print(table)
@@ -153,43 +198,49 @@ async def list_storage(
 # ── storage show ─────────────────────────────────────────────────────────
 
 
-def _render_storage_panel(node: str, storage: str, status: dict, config: dict) -> Panel:
-    """Build a Rich Panel for a single storage."""
-    lines = []
-    lines.append("[bold]── General ──[/bold]")
-    lines.append(f"[bold]Storage:[/bold]    {storage}")
-    lines.append(f"[bold]Node:[/bold]       {node}")
-    lines.append(f"[bold]Type:[/bold]       {status.get('type', 'unknown')}")
-
-    active = status.get("active", False)
-    enabled = status.get("enabled", True)
-    if active and enabled:
-        status_str = "[green]active[/green]"
-    elif enabled:
-        status_str = "[yellow]inactive[/yellow]"
-    else:
-        status_str = "[red]disabled[/red]"
-    lines.append(f"[bold]Status:[/bold]     {status_str}")
+_PANEL_GENERAL = (
+    "[bold]── General ──[/bold]\n"
+    "[bold]Storage:[/bold]    {storage}\n"
+    "[bold]Node:[/bold]       {node}\n"
+    "[bold]Type:[/bold]       {type}\n"
+    "[bold]Status:[/bold]     {status}\n"
+    "[bold]Content:[/bold]    {content}\n"
+    "[bold]Shared:[/bold]     {shared}"
+)
+_PANEL_PATH = "\n[bold]Path:[/bold]       {path}"
+_PANEL_CAPACITY = (
+    "\n\n[bold]── Capacity ──[/bold]\n"
+    "[bold]Total:[/bold]      {total}\n"
+    "[bold]Used:[/bold]       {used} ({used_pct})\n"
+    "[bold]Available:[/bold]  {avail}"
+)
 
-    lines.append(f"[bold]Content:[/bold]    {status.get('content', '-')}")
-    lines.append(f"[bold]Shared:[/bold]     {'Yes' if status.get('shared') else 'No'}")
 
-    if 'path' in config:
-        lines.append(f"[bold]Path:[/bold]       {config.get('path')}")
+def _render_storage_panel(node: str, storage: str, status: dict, config: dict) -> Panel:
+    """Build a Rich Panel for a single storage."""
+    body = _PANEL_GENERAL.format_map({
+        "storage": storage,
+        "node": node,
+        "type": status.get("type", "unknown"),
+        "status": _storage_status(status)[1],
+        "content": status.get("content", "-"),
+        "shared": "Yes" if status.get("shared") else "No",
+    })
+
+    if "path" in config:
+        body += _PANEL_PATH.format_map({"path": config.get("path")})
 
     total = status.get("total", 0)
-    used = status.get("used", 0)
-    avail = status.get("avail", 0)
-
     if total:
-        lines.append("")
-        lines.append("[bold]── Capacity ──[/bold]")
-        used_pct = (used / total * 100) if total else 0
-        lines.append(f"[bold]Total:[/bold]      {format_bytes(total)}")
-        lines.append(f"[bold]Used:[/bold]       {format_bytes(used)} ({format_percentage(used_pct)})")
-        lines.append(f"[bold]Available:[/bold]  {format_bytes(avail)}")
+        used = status.get("used", 0)
+        body += _PANEL_CAPACITY.format_map({
+            "total": format_bytes(total),
+            "used": format_bytes(used),
+            "used_pct": format_percentage(used / total * 100),
+            "avail": format_bytes(status.get("avail", 0)),
+        })
 
-    return Panel("\n".join(lines), title=f"Storage: {storage}", border_style="blue")
+    return Panel(body, title=f"Storage: {storage}", border_style="blue")
 
 
 @app.command("info")
@@ -213,7 +264,7 @@ async def show_storage(
 
             if not storage:
                 storages = await client.get_storage_list(node)
-                storage_ids = sorted(s.get("storage", "") for s in storages if s.get("storage"))
+                storage_ids = _sorted_storage_ids(storages)
                 if not storage_ids:
                     print_info(f"No storages found on node '{node}'")
                     return
@@ -228,9 +279,11 @@ async def show_storage(
             else:
                 selected_storages = [storage]
 
-            for sid in selected_storages:
-                status = await client.get_storage_status(node, sid)
-                config = await client.get_storage_config(sid)
+            pairs = await asyncio.gather(*(
+                asyncio.gather(client.get_storage_status(node, sid), client.get_storage_config(sid))
+                for sid in selected_storages
+            ))
+            for sid, (status, config) in zip(selected_storages, pairs, strict=True):
                 console.print(_render_storage_panel(node, sid, status, config))
 
     except KeyboardInterrupt:
@@ -244,9 +297,9 @@ async def show_storage(
 # ── storage config ───────────────────────────────────────────────────────
 
 
-_CONTENT_TYPES = [
+_CONTENT_TYPES = (
     "images", "rootdir", "vztmpl", "backup", "iso", "snippets", "import",
-]
+)
 
 
 @app.command("config")
@@ -266,9 +319,13 @@ async def config_storage(
             result = await _resolve_node_storage(client, node, storage)
             if result is None:
                 return
-            node, storage = result
+            node, storage, entry = result
 
-            config = await client.get_storage_config(storage)
+            # The picker's listing entry already carries type and content
+            if entry is not None and "type" in entry and "content" in entry:
+                config = entry
+            else:
+                config = await client.get_storage_config(storage)
             storage_type = config.get('type', 'unknown')
 
             console.print("\n[bold cyan]═══ Edit Storage ═══[/bold cyan]\n")
@@ -277,11 +334,11 @@ async def config_storage(
             console.print(f"[bold cyan]Type:[/bold cyan]    {storage_type}\n")
 
             current_content = config.get('content', '')
-            current_types = [ct.strip() for ct in current_content.split(',') if ct.strip()]
+            current_types = frozenset(ct.strip() for ct in current_content.split(',') if ct.strip())
 
             preselected = [i for i, name in enumerate(_CONTENT_TYPES) if name in current_types]
 
-            sel = multi_select_menu(_CONTENT_TYPES, "  Content types (Space to toggle, Enter to confirm):", preselected=preselected)
+            sel = multi_select_menu(list(_CONTENT_TYPES), "  Content types (Space to toggle, Enter to confirm):", preselected=preselected)
             if sel is None:
                 print_cancelled()
                 return
@@ -321,7 +378,7 @@ async def list_content(
     node: str = typer.Argument(None, help="Node name"),
     storage: str = typer.Argument(None, help="Storage ID"),
     profile: str = typer.Option(None, "--profile", "-p", help="Profile to use"),
-    content_type: str = typer.Option(None, "--type", "-t", help="Filter by content type"),
+    content_type: str = typer.Option(None, "--type", "-t", help="Filter by content type (comma-separated for several)"),
 ) -> None:
     """List storage content."""
     config_manager = ConfigManager()
@@ -333,9 +390,15 @@ async def list_content(
             result = await _resolve_node_storage(client, node, storage)
             if result is None:
                 return
-            node, storage = result
+            node, storage, _ = result
 
-            content = await client.get_storage_content(node, storage, content_type)
+            # --type accepts a comma list, one filtered request per type
+            types = [t.strip() for t in (content_type or "").split(",") if t.strip()] or [None]
+            results = await asyncio.gather(*(client.get_storage_content(node, storage, t) for t in types))
+            if len(results) == 1:
+                content = results[0]
+            else:
+                content = list({item["volid"]: item for lst in results for item in lst}.values())
 
             if not content:
                 print_info(f"No content found in storage '{storage}'")
@@ -390,7 +453,7 @@ async def add_content(
             result = await _resolve_node_storage(client, node, storage)
             if result is None:
                 return
-            node, storage = result
+            node, storage, _ = result
 
             if not source_file:
                 source_file = prompt("  File path")
@@ -400,8 +463,12 @@ async def add_content(
                 source_file = source_file.strip()
 
             file = Path(source_file)
-            if not file.exists():
-                print_error(f"File not found: {source_file}")
+            # One stat off the event loop stands for exists() + stat()
+            try:
+                file_stat = await asyncio.to_thread(file.stat)
+            except OSError as e:
+                # ENOTDIR, ELOOP, EACCES...: none leaves a file to upload
+                print_error(f"File not found: {source_file} ({e.strerror or e})")
                 raise typer.Exit(1)
 
             valid_types = ["iso", "vztmpl", "import"]
@@ -415,7 +482,7 @@ async def add_content(
                 print_error(f"Invalid content type '{content_type}'. Valid: {', '.join(valid_types)}")
                 raise typer.Exit(1)
 
-            file_size = file.stat().st_size
+            file_size = file_stat.st_size
 
             console.print(f"\n[bold]Upload details:[/bold]")
             console.print(f"  File:    {file.name}")
@@ -428,15 +495,29 @@ async def add_content(
                 print_cancelled()
                 return
 
-            console.print("\n[cyan]Uploading...[/cyan]")
+            from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TransferSpeedColumn
 
+            console.print()
             try:
-                upid = await client.upload_storage_content(
-                    node=node,
-                    storage=storage,
-                    content_type=content_type,
-                    file_path=str(file),
-                )
+                with Progress(
+                    TextColumn("[cyan]Uploading[/cyan]"),
+                    BarColumn(),
+                    DownloadColumn(),
+                    TransferSpeedColumn(),
+                    console=console,
+                    transient=True,
+                ) as upload_progress:
+                    bar = upload_progress.add_task("upload", total=file_size)
+                    upid = await client.upload_storage_content(
+                        node=node,
+                        storage=storage,
+                        content_type=content_type,
+                        file_path=str(file),
+                        progress=lambda n: upload_progress.advance(bar, n),
+                    )
+
+                # Start polling right away, the messages below print meanwhile
+                waiter = asyncio.create_task(client.wait_for_task(node, upid, initial_delay=0.05))
 
                 print_success("Upload started successfully")
                 console.print(f"[cyan]Task ID:[/cyan] {upid}")
@@ -450,7 +531,7 @@ async def add_content(
                     )
 
                 console.print("[cyan]Waiting for upload to complete...[/cyan]")
-                task_result = await client.wait_for_task(node, upid)
+                task_result = await waiter
 
                 exitstatus = task_result.get("exitstatus", "")
                 if exitstatus == "OK":
@@ -463,7 +544,7 @@ async def add_content(
                 print_error(str(e))
                 raise typer.Exit(1)
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         console.print()
         print_cancelled()
     except PVECliError as e:
@@ -502,7 +583,7 @@ async def download_content(
             result = await _resolve_node_storage(client, node, storage)
             if result is None:
                 return
-            node, storage = result
+            node, storage, _ = result
 
             if not url:
                 url = prompt("  URL")
@@ -616,7 +697,7 @@ async def remove_content(
             result = await _resolve_node_storage(client, node, storage)
             if result is None:
                 return
-            node, storage = result
+            node, storage, _ = result
 
             if not volume:
                 content = await client.get_storage_content(node, storage)
@@ -652,13 +733,19 @@ async def remove_content(
                 print_cancelled()
                 return
 
-            for vol in selected_volumes:
-                await client.delete(f"/nodes/{node}/storage/{storage}/content/{vol}")
+            results = await gather_bounded(
+                selected_volumes,
+                lambda vol: client.delete(f"/nodes/{node}/storage/{storage}/content/{vol}"),
+                lambda vol, e: print_error(f"Failed to delete volume '{vol}': {e}"),
+            )
+            deleted = [vol for vol, _ in results]
 
-            if len(selected_volumes) == 1:
-                print_success(f"Volume '{selected_volumes[0]}' deleted")
-            else:
-                print_success(f"{len(selected_volumes)} volumes deleted")
+            if len(deleted) == 1:
+                print_success(f"Volume '{deleted[0]}' deleted")
+            elif deleted:
+                print_success(f"{len(deleted)} volumes deleted")
+            if len(deleted) < len(selected_volumes):
+                raise typer.Exit(1)
 
     except KeyboardInterrupt:
         console.print()
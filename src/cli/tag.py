@@ -1,7 +1,13 @@
 """Global tag management commands."""
 
+import asyncio
+import copy
 import json
+import os
+import re
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
 
 import typer
 import yaml
@@ -9,10 +15,14 @@ from rich.table import Table
 from ..api.client import ProxmoxClient
 from ..api.exceptions import PVECliError
 from ..config import ConfigManager
-from ..utils import build_ordered_table, confirm, console, print_cancelled, print_error, print_success, print_warning, prompt
+from ..utils import build_ordered_table, confirm, console, parse_tags, print_cancelled, print_error, print_success, print_warning, prompt
 from ..utils.helpers import async_to_sync, ordered_group
 from ..utils.menu import multi_select_menu, select_menu
 
+_TAG_SEP = re.compile(r"[,;]")
+# Resources listed per tag in the tag remove summary before collapsing
+_SUMMARY_LIMIT = 20
+
 app = typer.Typer(help="Manage tags globally", no_args_is_help=True, cls=ordered_group(["add", "edit", "remove", "color", "export", "import", "list"]))
 color_app = typer.Typer(help="Manage color palette", no_args_is_help=True, cls=ordered_group(["add", "remove", "init", "list"]))
 app.add_typer(color_app, name="color")
@@ -31,31 +41,115 @@ _DEFAULT_PALETTE = {
 }
 
 _COLOR_FILE = Path.home() / ".config" / "pvecli" / "tag_color.yml"
+# JSON copy of tag_color.yml, much faster to load than YAML. It records the
+# (st_mtime_ns, st_size) of the YAML it was made from and is only used while
+# they match exactly: the YAML stays the file users edit.
+_COLOR_SIDECAR = Path.home() / ".cache" / "pvecli" / "tag_color.json"
+
+
+# Parsed palette with the (st_mtime_ns, st_size) of the file it was read
+# from, so commands touching the palette several times parse it once
+_PALETTE_CACHE: tuple[tuple[int, int], dict[str, dict]] | None = None
 
 
 def _load_palette() -> dict[str, dict]:
-    """Load color palette from tag_color.yml."""
-    if not _COLOR_FILE.exists():
-        return {}
+    """Load color palette from tag_color.yml.
+
+    Returns a fresh copy in name order, callers may mutate it.
+    """
+    global _PALETTE_CACHE
     try:
-        with open(_COLOR_FILE) as f:
-            data = yaml.safe_load(f) or {}
-        return data
-    except Exception:
+        st = _COLOR_FILE.stat()
+    except OSError:
         return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if _PALETTE_CACHE is None or _PALETTE_CACHE[0] != key:
+        data = _read_palette_sidecar(key)
+        if data is None:
+            try:
+                with open(_COLOR_FILE) as f:
+                    # Sorted once here (hand edits may reorder the file), so
+                    # every reader gets the palette in name order
+                    data = dict(sorted((yaml.safe_load(f) or {}).items()))
+            except Exception:
+                return {}
+            _write_palette_sidecar(data, key)
+        _PALETTE_CACHE = (key, data)
+    return copy.deepcopy(_PALETTE_CACHE[1])
+
+
+def _read_palette_sidecar(source: tuple[int, int]) -> dict[str, dict] | None:
+    """Read the JSON copy of the palette, None if missing or not made from source.
+
+    Args:
+        source: (st_mtime_ns, st_size) of the current tag_color.yml
+    """
+    try:
+        with open(_COLOR_SIDECAR) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # An exact match, not a newer mtime: a YAML restored with an older
+    # mtime (cp -p, rsync -a, backups) must not be shadowed by the JSON
+    if not isinstance(data, dict) or data.get("source") != list(source):
+        return None
+    return data.get("palette")
+
+
+def _write_palette_sidecar(palette: dict[str, dict], source: tuple[int, int]) -> None:
+    """Write the JSON copy of the palette (best effort, it is only a cache)."""
+    # Written aside then renamed, a concurrent reader never sees half a file
+    tmp = _COLOR_SIDECAR.with_name(f"{_COLOR_SIDECAR.name}.{os.getpid()}.tmp")
+    try:
+        _COLOR_SIDECAR.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump({"source": list(source), "palette": palette}, f)
+        os.replace(tmp, _COLOR_SIDECAR)
+    except OSError:
+        tmp.unlink(missing_ok=True)
 
 
 def _save_palette(palette: dict[str, dict]) -> None:
     """Save color palette to tag_color.yml."""
+    global _PALETTE_CACHE
     _COLOR_FILE.parent.mkdir(parents=True, exist_ok=True)
-    lines = []
-    for name in sorted(palette):
-        entry = palette[name]
-        lines.append(f"{name}:")
-        lines.append(f'  font: "{entry.get("font", "white")}"')
-        lines.append(f'  hex: "{entry.get("hex", "888888")}"')
-    with open(_COLOR_FILE, "w") as f:
-        f.write("\n".join(lines) + "\n")
+    text = "".join([
+        f'{name}:\n  font: "{palette[name].get("font", "white")}"\n  hex: "{palette[name].get("hex", "888888")}"\n'
+        for name in sorted(palette)
+    ])
+    # Written aside then renamed, an interrupted save never leaves a torn file
+    tmp = _COLOR_FILE.with_name(f"{_COLOR_FILE.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, _COLOR_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    st = _COLOR_FILE.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    # Same (sorted) order as a fresh parse of the file would give
+    ordered = copy.deepcopy({n: palette[n] for n in sorted(palette)})
+    _write_palette_sidecar(ordered, key)
+    _PALETTE_CACHE = (key, ordered)
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex_color(value: str) -> bool:
+    """Whether value is exactly six hex digits (no '#', sign, '0x' or '_')."""
+    return len(value) == 6 and _HEX_DIGITS.issuperset(value)
+
+
+def _ansi_swatch(name: str, bg_hex: str, fg_hex: str) -> str:
+    """Color picker entry ' name  (#bg)' as raw 24-bit ANSI escapes.
+
+    Same layout as the Rich fallback: only ' name ' sits on the tag color,
+    '(#bg)' keeps the font color on the default background.
+    """
+    bg = ";".join(str(int(bg_hex[k:k + 2], 16)) for k in (0, 2, 4))
+    fg = ";".join(str(int(fg_hex[k:k + 2], 16)) for k in (0, 2, 4))
+    return f"\x1b[48;2;{bg}m\x1b[38;2;{fg}m {name} \x1b[49m (#{bg_hex})\x1b[0m"
 
 
 def _get_full_palette() -> list[tuple[str, str, str]]:
@@ -71,13 +165,33 @@ def _get_full_palette() -> list[tuple[str, str, str]]:
 
 
 def _parse_color_map(tag_style) -> dict[str, str]:
-    """Parse color-map from tag-style (dict or string)."""
+    """Parse color-map from tag-style (dict or string).
+
+    String tag-styles are memoized; the returned dict is always a fresh one
+    that callers may mutate.
+    """
+    if isinstance(tag_style, str):
+        return dict(_parse_color_map_str(tag_style))
+    return _read_color_map(tag_style)
+
+
+@lru_cache(maxsize=128)
+def _parse_color_map_str(tag_style: str) -> tuple[tuple[str, str], ...]:
+    """Memoized, immutable parse of a string tag-style."""
+    return tuple(_read_color_map(tag_style).items())
+
+
+def _read_color_map(tag_style) -> dict[str, str]:
+    """Parse color-map from tag-style (dict or string), uncached."""
     colors = {}
     if not tag_style:
         return colors
 
     if isinstance(tag_style, dict):
         raw = tag_style.get("color-map", "")
+    elif isinstance(tag_style, str) and tag_style.startswith("color-map="):
+        # Usual form (as written by _build_tag_style): one slice, no split
+        raw = tag_style[len("color-map="):].partition(",")[0]
     elif isinstance(tag_style, str) and "color-map=" in tag_style:
         for part in tag_style.split(","):
             part = part.strip()
@@ -92,32 +206,40 @@ def _parse_color_map(tag_style) -> dict[str, str]:
     if not raw:
         return colors
     for entry in raw.split(";"):
-        entry = entry.strip()
-        if ":" in entry:
-            tag, color = entry.split(":", 1)
+        tag, sep, color = entry.partition(":")
+        if sep:
             colors[tag.strip()] = color.strip()
     return colors
 
 
 def _build_tag_style(color_map: dict[str, str], existing_style) -> str:
-    """Rebuild tag-style string with updated color-map."""
+    """Rebuild tag-style string with updated color-map.
+
+    Returns existing_style itself when the color-map is unchanged, so
+    callers comparing the two skip a no-op update.
+    """
+    if isinstance(existing_style, str) and color_map == _parse_color_map(existing_style):
+        return existing_style
     if color_map:
-        return "color-map=" + ";".join(f"{tag}:{color}" for tag, color in sorted(color_map.items()))
+        # A list, not a generator: join() materializes its argument first anyway
+        return "color-map=" + ";".join([f"{tag}:{color}" for tag, color in sorted(color_map.items())])
     return ""
 
 
-def _pick_color(tag_name: str) -> str | None:
-    """Interactive color picker with arrow navigation and Rich-colored entries."""
-    import os
+def _pick_color(tag_name: str, palette: list[tuple[str, str, str]] | None = None) -> str | None:
+    """Interactive color picker with arrow navigation and Rich-colored entries.
+
+    Args:
+        tag_name: Tag the color is picked for (shown in the title).
+        palette: Preloaded _get_full_palette() result, loaded here if None.
+    """
     import select
     import sys
     import termios
     import tty
-    from io import StringIO
-
-    from rich.console import Console as RichConsole
 
-    palette = _get_full_palette()
+    if palette is None:
+        palette = _get_full_palette()
     if not palette:
         print_warning("No colors available. Run 'pvecli tag color init' first.")
         return None
@@ -126,17 +248,39 @@ def _pick_color(tag_name: str) -> str | None:
     n = len(palette)
     menu_lines = n + 2  # title + blank + entries
 
-    def _render():
+    # Every entry rendered once in both states, a keypress only rewrites
+    # the row losing the cursor and the row gaining it
+    if console.color_system == "truecolor" and all(_is_hex_color(c) for _, c, _ in palette):
+        # Plain 24-bit escapes, no Rich console involved
+        plain_rows = [f"    {_ansi_swatch(cname, c, font)}" for cname, c, font in palette]
+        selected_rows = [f"  \x1b[36m>\x1b[0m {_ansi_swatch(cname, c, font)}" for cname, c, font in palette]
+        header = f"  Color for '\x1b[36m{tag_name}\x1b[0m':\n\n"
+    else:
+        # Let Rich downgrade the colors to what the terminal supports
+        from io import StringIO
+
+        from rich.console import Console as RichConsole
+
         buf = StringIO()
         rc = RichConsole(file=buf, force_terminal=True, width=console.width)
-        rc.print(f"  Color for '[cyan]{tag_name}[/cyan]':")
-        rc.print()
-        for i, (cname, c, font) in enumerate(palette):
-            if i == selected:
-                rc.print(f"  [cyan]>[/cyan] [on #{c}][#{font}] {cname} [/][#{font}] (#{c})[/]")
-            else:
-                rc.print(f"    [on #{c}][#{font}] {cname} [/][#{font}] (#{c})[/]")
-        return buf.getvalue()
+
+        def _capture(markup: str) -> str:
+            rc.print(markup, end="")
+            out = buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            return out
+
+        plain_rows = [_capture(f"    [on #{c}][#{font}] {cname} [/][#{font}] (#{c})[/]") for cname, c, font in palette]
+        selected_rows = [
+            _capture(f"  [cyan]>[/cyan] [on #{c}][#{font}] {cname} [/][#{font}] (#{c})[/]") for cname, c, font in palette
+        ]
+        header = _capture(f"  Color for '[cyan]{tag_name}[/cyan]':") + "\n\n"
+
+    def _row(i: int, rows: list[str]) -> str:
+        # The cursor rests on the line below the menu, entry i is n - i up
+        up = n - i
+        return f"\x1b[{up}A\r{rows[i]}\x1b[K\x1b[{up}B\r"
 
     fd = sys.stdin.fileno()
 
@@ -154,58 +298,77 @@ def _pick_color(tag_name: str) -> str | None:
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
-    sys.stdout.write("\x1b[?25l")  # Hide cursor
-    sys.stdout.write(_render())
-    sys.stdout.flush()
+    def _emit(frame: str) -> None:
+        # One write + flush per frame, escapes and text together
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+    # Hide cursor, first draw (entry 0 selected)
+    _emit("\x1b[?25l" + header + "\n".join([selected_rows[0], *plain_rows[1:]]) + "\n")
 
     try:
         while True:
             key = _read_key()
             if key == "\x1b[A":  # Up
-                selected = (selected - 1) % n
+                new = (selected - 1) % n
             elif key == "\x1b[B":  # Down
-                selected = (selected + 1) % n
+                new = (selected + 1) % n
             elif key in ("\r", "\n"):  # Enter
-                sys.stdout.write(f"\x1b[{menu_lines}A\x1b[J")
-                sys.stdout.write("\x1b[?25h")
-                sys.stdout.flush()
+                _emit(f"\x1b[{menu_lines}A\x1b[J\x1b[?25h")
                 return palette[selected][1]
             elif key in ("\x1b", "\x03"):  # Esc or Ctrl+C
-                sys.stdout.write(f"\x1b[{menu_lines}A\x1b[J")
-                sys.stdout.write("\x1b[?25h")
-                sys.stdout.flush()
+                _emit(f"\x1b[{menu_lines}A\x1b[J\x1b[?25h")
                 print_cancelled()
                 return None
             else:
                 continue
 
-            # Redraw
-            sys.stdout.write(f"\x1b[{menu_lines}A\x1b[J")
-            sys.stdout.write(_render())
-            sys.stdout.flush()
+            _emit(_row(selected, plain_rows) + _row(new, selected_rows))
+            selected = new
     except (KeyboardInterrupt, EOFError):
-        sys.stdout.write("\x1b[?25h\n")
-        sys.stdout.flush()
+        _emit("\x1b[?25h\n")
         print_cancelled()
         return None
 
 
-def _count_tags_from_resources(resources: list[dict]) -> dict[str, dict]:
-    """Count tags from pre-fetched resources."""
+def _resource_key(r: dict) -> tuple[str, Any]:
+    """Identify a cluster resource entry by (node, vmid)."""
+    return r.get("node", ""), r.get("vmid")
+
+
+def _index_tags_from_resources(
+    resources: list[dict],
+) -> tuple[dict[str, dict], dict[str, list[dict]], dict[tuple[str, Any], list[str]]]:
+    """Count tags from pre-fetched resources and index the resources carrying each tag.
+
+    Returns ({tag: {"vms": count, "cts": count}}, {tag: [resource, ...]},
+    {(node, vmid): [tag, ...]}). The parsed tag lists are kept aside rather
+    than on the resources, which may be the client's cached listing, so later
+    steps never split a tag string again.
+    """
     tag_counts: dict[str, dict] = {}
+    tag_resources: dict[str, list[dict]] = {}
+    resource_tags: dict[tuple[str, Any], list[str]] = {}
     for r in resources:
         tags_str = r.get("tags", "")
         if not tags_str:
             continue
         rtype = "vms" if r.get("type") == "qemu" else "cts"
-        for tag in tags_str.split(";"):
-            tag = tag.strip()
-            if not tag:
-                continue
+        tags = resource_tags[_resource_key(r)] = parse_tags(tags_str)
+        for tag in tags:
             if tag not in tag_counts:
                 tag_counts[tag] = {"vms": 0, "cts": 0}
+                tag_resources[tag] = []
             tag_counts[tag][rtype] += 1
-    return tag_counts
+            bucket = tag_resources[tag]
+            if not bucket or bucket[-1] is not r:  # tag repeated on one resource
+                bucket.append(r)
+    return tag_counts, tag_resources, resource_tags
+
+
+def _count_tags_from_resources(resources: list[dict]) -> dict[str, dict]:
+    """Count tags from pre-fetched resources."""
+    return _index_tags_from_resources(resources)[0]
 
 
 async def _collect_all_tags(client: ProxmoxClient) -> dict[str, dict]:
@@ -233,8 +396,9 @@ async def list_tags(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            tag_counts = await _collect_all_tags(client)
-            options = await client.get_cluster_options()
+            tag_counts, options = await asyncio.gather(
+                _collect_all_tags(client), client.get_cluster_options()
+            )
             color_map = _parse_color_map(options.get("tag-style", ""))
 
             # Merge tags from color-map that may not be in use
@@ -302,15 +466,20 @@ async def add_tag(
                 raise typer.Exit(1)
             tag = tag.strip()
 
-        if not color:
-            color = _pick_color(tag)
-            if color is None:
-                return
-
-        # Strip leading # if provided
-        color = color.lstrip("#")
+        # The palette file is read while the client logs in
+        palette_task = asyncio.create_task(asyncio.to_thread(_get_full_palette)) if not color else None
 
         async with ProxmoxClient(profile_config) as client:
+            if palette_task is not None:
+                # The picker owns the terminal, it stays on the main thread
+                color = _pick_color(tag, await palette_task)
+                if color is None:
+                    return
+
+            # Strip leading # if provided
+            color = color.lstrip("#")
+
+            # Read right before the write, the tag-style is replaced as a whole
             options = await client.get_cluster_options()
             existing_style = options.get("tag-style", "")
             color_map = _parse_color_map(existing_style)
@@ -343,12 +512,12 @@ async def edit_tag(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            options = await client.get_cluster_options()
+            options, resources = await asyncio.gather(
+                client.get_cluster_options(), client.get_cluster_resources(resource_type="vm")
+            )
             existing_style = options.get("tag-style", "")
             color_map = _parse_color_map(existing_style)
-
-            resources = await client.get_cluster_resources(resource_type="vm")
-            tag_counts = _count_tags_from_resources(resources)
+            tag_counts, tag_resources, resource_tags = _index_tags_from_resources(resources)
             all_tags = sorted(set(tag_counts) | set(color_map))
 
             if not all_tags:
@@ -392,11 +561,8 @@ async def edit_tag(
             # Apply rename on every VM/CT carrying the tag
             renamed_count = 0
             if rename:
-                for r in resources:
-                    tags_str = r.get("tags", "")
-                    tags = [x.strip() for x in tags_str.split(";") if x.strip()]
-                    if tag not in tags:
-                        continue
+                for r in tag_resources.get(tag, []):
+                    tags = resource_tags[_resource_key(r)]
                     new_tags = ";".join(dict.fromkeys(new_name if x == tag else x for x in tags))
                     if r.get("type") == "qemu":
                         await client.update_vm_config(r.get("node", ""), r.get("vmid"), tags=new_tags)
@@ -442,9 +608,10 @@ async def remove_tag(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            resources = await client.get_cluster_resources(resource_type="vm")
-            tag_counts = _count_tags_from_resources(resources)
-            options = await client.get_cluster_options()
+            resources, options = await asyncio.gather(
+                client.get_cluster_resources(resource_type="vm"), client.get_cluster_options()
+            )
+            tag_counts, tag_resources, resource_tags = _index_tags_from_resources(resources)
             existing_style = options.get("tag-style", "")
             color_map = _parse_color_map(existing_style)
             all_tags = sorted(set(tag_counts) | set(color_map))
@@ -463,21 +630,15 @@ async def remove_tag(
                     print_cancelled()
                     return
             else:
-                import re
-                selected_tags = [t.strip() for t in re.split(r"[,;]", tag) if t.strip()]
+                selected_tags = [t.strip() for t in _TAG_SEP.split(tag) if t.strip()]
+            # A tag named twice is removed once
+            selected_tags = list(dict.fromkeys(selected_tags))
 
             # Collect affected resources and color info for all selected tags
             total_affected = 0
             tag_details: list[tuple[str, list, bool]] = []
             for t in selected_tags:
-                affected = []
-                for r in resources:
-                    tags_str = r.get("tags", "")
-                    if not tags_str:
-                        continue
-                    tags = [x.strip() for x in tags_str.split(";") if x.strip()]
-                    if t in tags:
-                        affected.append(r)
+                affected = tag_resources.get(t, [])
                 has_color = t in color_map
                 tag_details.append((t, affected, has_color))
                 total_affected += len(affected)
@@ -489,10 +650,12 @@ async def remove_tag(
                     continue
                 if affected:
                     console.print(f"\nTag '{t}' found on {len(affected)} resource(s):")
-                    for r in affected:
+                    for r in affected[:_SUMMARY_LIMIT]:
                         rtype = "VM" if r.get("type") == "qemu" else "CT"
                         name = r.get("name", "")
                         console.print(f"  {rtype} {r.get('vmid', '?')} ({name})")
+                    if len(affected) > _SUMMARY_LIMIT:
+                        console.print(f"  [dim]...and {len(affected) - _SUMMARY_LIMIT} more[/dim]")
                 if has_color:
                     c = color_map[t]
                     bg = c.split(":")[0]
@@ -509,35 +672,47 @@ async def remove_tag(
                 print_cancelled()
                 return
 
-            # Remove tags from resources
+            # Drop every selected tag from each resource's parsed tag list
+            # first, so a resource carrying several of them gets one update.
             total_removed = 0
             color_removed = 0
+            pending: dict[tuple[str, Any], tuple[dict, list[str]]] = {}
             for t, affected, has_color in actionable:
                 for r in affected:
-                    node = r.get("node", "")
-                    vmid = r.get("vmid")
-                    tags_str = r.get("tags", "")
-                    tags = [x.strip() for x in tags_str.split(";") if x.strip()]
-                    tags.remove(t)
-                    new_tags = ";".join(tags)
-
-                    if r.get("type") == "qemu":
-                        await client.update_vm_config(node, vmid, tags=new_tags)
-                    else:
-                        await client.update_container_config(node, vmid, tags=new_tags)
+                    key = _resource_key(r)
+                    entry = pending.get(key)
+                    if entry is None:
+                        entry = pending[key] = (r, list(resource_tags[key]))
+                    if t in entry[1]:
+                        entry[1].remove(t)
                 total_removed += len(affected)
 
                 if has_color:
                     del color_map[t]
                     color_removed += 1
 
-            # Update color map once
+            from ._shared import gather_bounded  # _shared imports this module
+
+            # (label, request) pairs; the color map is updated once, alongside the resources
+            updates = []
+            for r, tags in pending.values():
+                qemu = r.get("type") == "qemu"
+                update = client.update_vm_config if qemu else client.update_container_config
+                updates.append((
+                    f"{'VM' if qemu else 'CT'} {r.get('vmid', '?')}",
+                    partial(update, r.get("node", ""), r.get("vmid"), tags=";".join(tags)),
+                ))
             if color_removed:
-                new_style = _build_tag_style(color_map, existing_style)
-                if new_style:
-                    await client.update_cluster_options(**{"tag-style": new_style})
-                else:
-                    await client.update_cluster_options(**{"tag-style": ""})
+                tag_style = _build_tag_style(color_map, existing_style)
+                updates.append(("color map", partial(client.update_cluster_options, **{"tag-style": tag_style})))
+
+            done = await gather_bounded(
+                updates,
+                lambda item: item[1](),
+                lambda item, e: print_error(f"Failed to update {item[0]}: {e}"),
+            )
+            if len(done) < len(updates):
+                raise typer.Exit(1)
 
             if len(actionable) == 1:
                 t = actionable[0][0]
@@ -571,8 +746,9 @@ async def export_tags(
         profile_config = config_manager.get_profile(profile)
 
         async with ProxmoxClient(profile_config) as client:
-            tag_counts = await _collect_all_tags(client)
-            options = await client.get_cluster_options()
+            tag_counts, options = await asyncio.gather(
+                _collect_all_tags(client), client.get_cluster_options()
+            )
             color_map = _parse_color_map(options.get("tag-style", ""))
 
             all_tags = sorted(set(tag_counts) | set(color_map))
@@ -739,21 +915,15 @@ def color_add(
             while True:
                 hex_color = prompt("  Hex code (e.g. 00bcd4)")
                 hex_color = hex_color.strip().lstrip("#")
-                if len(hex_color) == 6:
-                    try:
-                        int(hex_color, 16)
-                        break
-                    except ValueError:
-                        pass
+                if _is_hex_color(hex_color):
+                    break
                 print_error("Invalid hex color, must be 6 hex characters (e.g. 00bcd4)")
         else:
             hex_color = hex_color.lstrip("#")
             if len(hex_color) != 6:
                 print_error("Hex color must be 6 characters (e.g. 00bcd4)")
                 raise typer.Exit(1)
-            try:
-                int(hex_color, 16)
-            except ValueError:
+            if not _is_hex_color(hex_color):
                 print_error("Invalid hex color")
                 raise typer.Exit(1)
 
@@ -798,7 +968,7 @@ def color_remove(
             return
 
         if name is None:
-            color_names = sorted(palette.keys())
+            color_names = list(palette)  # already in name order
             sel = multi_select_menu(color_names, "  Colors to remove (Space to toggle, Enter to confirm):")
             if sel is None:
                 print_cancelled()
@@ -19,6 +19,12 @@ class Config(BaseModel):
     output: OutputConfig = Field(default_factory=OutputConfig)
 
 
+# Parsed (and decrypted) configs keyed by file path, valid while the file's
+# mtime is unchanged. Saves re-parsing the YAML and re-running age decryption
+# when several ConfigManager instances load the same file in one process.
+_LOAD_CACHE: dict[Path, tuple[int, Config]] = {}
+
+
 class ConfigManager:
     """Manage pvecli configuration."""
 
@@ -56,12 +62,19 @@ class ConfigManager:
         Raises:
             ConfigError: If config file doesn't exist or is invalid
         """
-        if not self.exists():
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
             raise ConfigError(
                 f"Configuration file not found at {self.config_file}. "
                 "Run 'pvecli config add' to create one."
             )
 
+        cached = _LOAD_CACHE.get(self.config_file)
+        if cached is not None and cached[0] == mtime_ns:
+            self._config = cached[1].model_copy(deep=True)
+            return self._config
+
         try:
             with open(self.config_file) as f:
                 data = yaml.safe_load(f) or {}
@@ -70,6 +83,7 @@ class ConfigManager:
             needs_save = self._decrypt_config(self._config)
             if needs_save:
                 self.save(self._config)
+            self._remember(self._config)
             return self._config
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in config file: {e}")
@@ -93,9 +107,17 @@ class ConfigManager:
                 yaml.safe_dump(data, f, default_flow_style=False)
             os.chmod(self.config_file, 0o600)
             self._config = config
+            self._remember(config)
         except Exception as e:
             raise ConfigError(f"Failed to save config: {e}")
 
+    def _remember(self, config: Config) -> None:
+        """Cache a copy of the config against the current file mtime."""
+        _LOAD_CACHE[self.config_file] = (
+            self.config_file.stat().st_mtime_ns,
+            config.model_copy(deep=True),
+        )
+
     def get(self) -> Config:
         """Get current configuration, loading if necessary.
 
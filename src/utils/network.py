@@ -1,6 +1,7 @@
 """Network utilities for resolving VM/CT IP addresses."""
 
 import socket
+from functools import lru_cache
 
 from ..api.exceptions import PVECliError
 
@@ -42,7 +43,16 @@ def format_host_for_url(host: str) -> str:
 
 def resolve_node_host(profile_config) -> str:
     """Extract hostname from profile config (without scheme or port)."""
-    host = profile_config.host
+    return _resolve_host(profile_config.host)
+
+
+@lru_cache(maxsize=16)
+def _resolve_host(host: str) -> str:
+    """Strip scheme, brackets and port from a profile host string.
+
+    Memoized on the raw host string: profile configs are not hashable, and
+    several commands resolve the same profile host more than once per run.
+    """
     if "://" in host:
         host = host.split("://", 1)[1]
     # Bracketed IPv6 → strip brackets, drop optional trailing port
@@ -2,6 +2,7 @@
 
 import json
 import sys
+from functools import lru_cache
 from typing import Any
 
 import typer
@@ -172,8 +173,10 @@ def build_ordered_table(
     table = Table(title=title, show_header=True, header_style="bold cyan")
     for name, kwargs in columns:
         table.add_column(name, **kwargs)
+    names = [name for name, _ in columns]
+    add_row = table.add_row
     for row in rows:
-        table.add_row(*(row.get(name, (None, "-"))[1] for name, _ in columns))
+        add_row(*[row.get(name, (None, "-"))[1] for name in names])
     return table
 
 
@@ -258,9 +261,13 @@ def format_bytes(bytes_value: float, binary: bool = False) -> str:
     return f"{value:.1f} {last}"
 
 
+@lru_cache(maxsize=4096)
 def format_uptime(seconds: int) -> str:
     """Format uptime in seconds to human-readable string.
 
+    Memoized: list tables format one uptime per row and render the same
+    value again in detail panels.
+
     Args:
         seconds: Uptime in seconds.
 
@@ -298,20 +305,27 @@ def format_percentage(value: float, decimals: int = 1) -> str:
 def usage_bar(percent: float, width: int = 10, label: str = "") -> str:
     """Format a usage bar with color coding.
 
+    The percentage is rounded to a whole number, as displayed, so the bar
+    itself comes from a small cache shared by every row of a listing.
+
     Args:
         percent: Usage percentage (0-100)
         width: Bar width in characters
         label: Extra label after the bar
     """
-    percent = max(0.0, min(100.0, percent))
+    bar = _usage_bar(round(max(0.0, min(100.0, percent))), width)
+    if label:
+        return f"{bar} {label}"
+    return bar
+
+
+@lru_cache(maxsize=512)
+def _usage_bar(percent: int, width: int) -> str:
+    """Render the colored bar and percentage of usage_bar."""
     filled = round(percent / 100 * width)
     empty = width - filled
     color = "green" if percent < 60 else "yellow" if percent < 85 else "red"
-    bar = f"[{color}]{'━' * filled}[/{color}][dim]{'━' * empty}[/dim]"
-    pct = f"{percent:.0f}%"
-    if label:
-        return f"{bar} {pct} {label}"
-    return f"{bar} {pct}"
+    return f"[{color}]{'━' * filled}[/{color}][dim]{'━' * empty}[/dim] {percent}%"
 
 
 def get_status_color(status: str) -> str:
@@ -3,7 +3,8 @@
 
 def parse_tags(tags_str: str) -> list[str]:
     """Parse a semicolon-separated tags string into a list."""
-    return [t.strip() for t in tags_str.split(";") if t.strip()]
+    # Each tag stripped once, the result reused for the emptiness test
+    return [tag for t in tags_str.split(";") if (tag := t.strip())]
 
 
 def join_tags(tags: list[str]) -> str:
@@ -1,6 +1,9 @@
 """Background VNC proxy server entry point.
 
-Usage: python -m src.vnc '{"proxmox_host": ..., ...}'
+Usage: echo '{"proxmox_host": ..., ...}' | python -m src.vnc
+
+The JSON config is read from stdin so auth headers stay out of argv.
+A config passed as the first argument is still accepted.
 """
 
 import asyncio
@@ -11,7 +14,8 @@ from .server import VNCProxyServer
 
 
 def main() -> None:
-    config = json.loads(sys.argv[1])
+    raw = sys.argv[1] if len(sys.argv) > 1 else sys.stdin.read()
+    config = json.loads(raw)
     server = VNCProxyServer(**config)
     asyncio.run(server.run(interactive=False))
 
@@ -5,6 +5,7 @@ import mimetypes
 import ssl
 import sys
 import time
+from collections.abc import Mapping
 from http import HTTPStatus
 from pathlib import Path, PurePosixPath
 from urllib.parse import quote, unquote, urlparse
@@ -31,7 +32,7 @@ class VNCProxyServer:
         ws_path: str,
         vncticket: str,
         pve_port: int,
-        auth_headers: dict[str, str],
+        auth_headers: Mapping[str, str],
         local_port: int,
         verify_ssl: bool = False,
         vnc_password: str | None = None,